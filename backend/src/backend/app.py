@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from .router import router as api_router
 from .schedule_executor import executor as schedule_executor
+from .schedules import schedule_read_scope
 from .ubiquiti.utils import configure_logging, logger
 
 configure_logging()
@@ -33,6 +34,13 @@ app.add_middleware(
 app.include_router(api_router)
 
 
+@app.middleware("http")
+async def _scope_schedule_reads(request: Request, call_next) -> Response:
+    # Repeated schedule reads within one request hit the database once.
+    with schedule_read_scope():
+        return await call_next(request)
+
+
 @app.get("/health", tags=["health"])
 def health() -> dict[str, str]:
     """Simple readiness probe."""
@@ -7,6 +7,7 @@ from functools import lru_cache
 from pathlib import Path
 from threading import Lock
 
+from loguru import logger
 from pydantic import BaseModel, Field
 from sqlalchemy import Engine, create_engine, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
@@ -18,6 +19,7 @@ class DatabaseSettings(BaseModel):
     url: str | None = Field(default=None)
     echo: bool = Field(default=False)
     mode: str = Field(default="memory")
+    query_cache_size: int = Field(default=5000)
 
     @classmethod
     def load(cls) -> DatabaseSettings:
@@ -26,9 +28,26 @@ class DatabaseSettings(BaseModel):
             echo=os.getenv("UBIQUITI_DB_ECHO", "false").lower()
             in {"1", "true", "yes", "on"},
             mode=os.getenv("UBIQUITI_DB_MODE", "memory").lower(),
+            query_cache_size=_env_int("UBIQUITI_DB_QUERY_CACHE_SIZE", 5000),
         )
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = -1
+    if value < 0:
+        logger.bind(name=name, value=raw).warning(
+            "Ignoring invalid integer setting; using default {}", default
+        )
+        return default
+    return value
+
+
 @lru_cache
 def get_database_settings() -> DatabaseSettings:
     """Return cached database settings."""
@@ -62,7 +81,6 @@ def _prepare_schema(engine: Engine) -> None:
         Base,
         ScheduleGroupMembershipModel,
         ScheduleGroupModel,
-        ScheduleModel,
     )  # Local import to avoid circular deps
 
     Base.metadata.create_all(engine)
@@ -114,6 +132,11 @@ def _prepare_schema(engine: Engine) -> None:
                     },
                 )
 
+    # create_all() only indexes tables it creates, so backfill legacy databases.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
 
 def _now_iso() -> str:
     from datetime import datetime, timezone
@@ -140,6 +163,7 @@ def get_engine() -> Engine | None:
                     settings.url,
                     echo=settings.echo,
                     future=True,
+                    query_cache_size=settings.query_cache_size,
                 )
                 _prepare_schema(_engine)
     return _engine
@@ -162,6 +186,7 @@ def get_session_factory() -> sessionmaker[Session]:
                     bind=engine,
                     autoflush=False,
                     autocommit=False,
+                    expire_on_commit=False,
                     future=True,
                 )
     return _session_factory
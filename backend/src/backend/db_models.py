@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
 class Base(DeclarativeBase):
@@ -24,6 +24,9 @@ class DeviceModel(Base):
     """ORM model representing registered devices."""
 
     __tablename__ = "devices"
+    # mac is already covered by its unique constraint; list_by_owner() filters on
+    # owner_key, so it gets its own index.
+    __table_args__ = (Index("ix_devices_owner_key", "owner_key"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -36,6 +39,7 @@ class ScheduleModel(Base):
     """ORM model representing device lock schedules."""
 
     __tablename__ = "schedules"
+    __table_args__ = (Index("ix_schedules_scope_owner", "scope", "owner_key"),)
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     scope: Mapped[str] = mapped_column(String(16), nullable=False)
@@ -73,11 +77,22 @@ class ScheduleGroupModel(Base):
     created_at: Mapped[str] = mapped_column(String(64), nullable=False)
     updated_at: Mapped[str] = mapped_column(String(64), nullable=False)
 
+    # Read-only view over the membership table; memberships are written explicitly.
+    # Lazy loading raises so callers must opt in with selectinload().
+    schedules: Mapped[list[ScheduleModel]] = relationship(
+        "ScheduleModel",
+        secondary="schedule_group_memberships",
+        lazy="raise",
+        viewonly=True,
+    )
+
 
 class ScheduleGroupMembershipModel(Base):
     """Association table mapping schedules to groups (many-to-many)."""
 
     __tablename__ = "schedule_group_memberships"
+    # The composite primary key leads with group_id; lookups by schedule need their own.
+    __table_args__ = (Index("ix_schedule_group_memberships_schedule", "schedule_id"),)
 
     group_id: Mapped[str] = mapped_column(
         String(64),
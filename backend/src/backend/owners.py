@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Protocol
@@ -28,6 +29,9 @@ class OwnerRepository(Protocol):
     def get(self, key: str | None) -> Owner | None:
         ...
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, Owner]:
+        ...
+
     def list_all(self) -> list[Owner]:
         ...
 
@@ -52,6 +56,14 @@ class InMemoryOwnerRepository(OwnerRepository):
             return None
         return self._owners.get(key.lower())
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, Owner]:
+        found: dict[str, Owner] = {}
+        for key in keys:
+            owner = self._owners.get(key.lower())
+            if owner is not None:
+                found[key.lower()] = owner
+        return found
+
     def list_all(self) -> list[Owner]:
         return list(self._owners.values())
 
@@ -89,6 +101,21 @@ class SQLAlchemyOwnerRepository(OwnerRepository):
                 else None
             )
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, Owner]:
+        lowered = {key.lower() for key in keys}
+        if not lowered:
+            return {}
+        with self._session_factory() as session:
+            rows = (
+                session.execute(select(OwnerModel).where(OwnerModel.key.in_(lowered)))
+                .scalars()
+                .all()
+            )
+            return {
+                row.key: Owner(key=row.key, display_name=row.display_name, pin=row.pin)
+                for row in rows
+            }
+
     def list_all(self) -> list[Owner]:
         with self._session_factory() as session:
             rows = session.execute(select(OwnerModel)).scalars().all()
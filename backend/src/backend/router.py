@@ -3,26 +3,32 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
 from . import schemas
 from .device_types import add_device_type, list_device_types, remove_device_type
 from .events import Event, list_recent_events, record_event
 from .owners import Owner, delete_owner, get_owner_repository, register_owner
+from .schedules import get_schedule_repository
 from .services import (
+    ActionResult,
+    ClientRecord,
     DeviceRecord,
     apply_lock_action,
     build_device_from_target,
     get_device_detail_record,
     get_registered_device_records,
     get_unregistered_client_records,
+    iter_registered_device_records,
     register_device_for_owner,
     summarize_owner_records,
 )
-from .schedules import get_schedule_repository
 from .ubiquiti.devices import get_device_repository
 from .ubiquiti.unifi import UniFiAPIError
 
@@ -30,40 +36,99 @@ router = APIRouter(prefix="/api", tags=["devices"])
 
 
 def _filter_device_records(
-    records: list[DeviceRecord],
+    records: Iterable[DeviceRecord],
     owners: list[str] | None,
     locked: bool | None,
     search: str | None,
-) -> list[DeviceRecord]:
-    filtered = list(records)
+) -> Iterator[DeviceRecord]:
+    filtered = iter(records)
     if owners:
         owner_set = {value.lower() for value in owners}
-        filtered = [record for record in filtered if record["owner"] in owner_set]
+        filtered = (record for record in filtered if record.owner in owner_set)
 
     if locked is not None:
-        filtered = [record for record in filtered if record["locked"] is locked]
+        filtered = (record for record in filtered if record.locked is locked)
 
     if search:
         needle = search.strip().lower()
         if needle:
-            filtered = [
+            filtered = (
                 record
                 for record in filtered
                 if any(
                     needle in str(value).lower()
                     for value in (
-                        record["name"],
-                        record["owner"],
-                        record["type"],
-                        record["mac"],
-                        record["vendor"],
+                        record.name,
+                        record.owner,
+                        record.type,
+                        record.mac,
+                        record.vendor,
                     )
                     if value
                 )
-            ]
+            )
     return filtered
 
 
+def _json_response(model: BaseModel) -> Response:
+    # The large list endpoints are assembled from trusted records, so serialise
+    # them straight to JSON bytes with pydantic-core instead of letting FastAPI
+    # re-validate the whole response model first. response_model on the route
+    # still documents the shape.
+    return Response(
+        content=model.model_dump_json(by_alias=True),
+        media_type="application/json",
+    )
+
+
+def _stream_json_list(key: str, items: Iterable[BaseModel]) -> StreamingResponse:
+    # Emits {"<key>": [...]} one item at a time so the first records go out
+    # before the rest are built.
+    def chunks() -> Iterator[bytes]:
+        yield b'{"' + key.encode() + b'":['
+        separator = b""
+        for item in items:
+            yield separator + item.__pydantic_serializer__.to_json(item, by_alias=True)
+            separator = b","
+        yield b"]}"
+
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
+# Service records are built from already-normalised data with matching field
+# types, so response schemas are assembled with model_construct and skip
+# re-validation.
+def _device_record_to_schema(record: DeviceRecord) -> schemas.DeviceStatus:
+    return schemas.DeviceStatus.model_construct(
+        name=record.name,
+        owner=record.owner,
+        type=record.type,
+        mac=record.mac,
+        locked=record.locked,
+        vendor=record.vendor,
+    )
+
+
+def _action_result_to_schema(result: ActionResult) -> schemas.DeviceActionResult:
+    return schemas.DeviceActionResult.model_construct(
+        mac=result.mac,
+        locked=result.locked,
+        status=result.status,
+        message=result.message,
+    )
+
+
+def _client_to_schema(client: ClientRecord) -> schemas.UnregisteredClient:
+    return schemas.UnregisteredClient.model_construct(
+        name=client.name,
+        mac=client.mac,
+        ip=client.ip,
+        vendor=client.vendor,
+        last_seen=client.last_seen,
+        locked=client.locked,
+    )
+
+
 def _require_owner(owner_key: str) -> None:
     owner_repo = get_owner_repository()
     if owner_repo.get(owner_key) is None:
@@ -147,14 +212,14 @@ def get_dashboard_summary() -> schemas.DashboardSummary:
         raise HTTPException(status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
     total_devices = len(records)
-    locked_devices = sum(1 for record in records if record["locked"])
-    unknown_vendors = sum(1 for record in records if not record["vendor"])
+    locked_devices = sum(1 for record in records if record.locked)
+    unknown_vendors = sum(1 for record in records if not record.vendor)
 
     return schemas.DashboardSummary(
         total_devices=total_devices,
         locked_devices=locked_devices,
         unlocked_devices=max(total_devices - locked_devices, 0),
-        owner_count=len({record["owner"] for record in records}),
+        owner_count=len({record.owner for record in records}),
         unknown_vendors=unknown_vendors,
         generated_at=datetime.now(tz=UTC).astimezone(),
     )
@@ -165,25 +230,15 @@ def list_devices(
     owner: Annotated[list[str] | None, Query()] = None,
     locked: Annotated[bool | None, Query()] = None,
     search: Annotated[str | None, Query()] = None,
-) -> schemas.DeviceListResponse:
+) -> Response:
     try:
-        records = get_registered_device_records()
+        records = iter_registered_device_records()
     except UniFiAPIError as exc:
         raise HTTPException(status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
     filtered = _filter_device_records(records, owner, locked, search)
-    return schemas.DeviceListResponse(
-        devices=[
-            schemas.DeviceStatus(
-                name=record["name"],
-                owner=record["owner"],
-                type=record["type"],
-                mac=record["mac"],
-                locked=record["locked"],
-                vendor=record["vendor"],
-            )
-            for record in filtered
-        ]
+    return _stream_json_list(
+        "devices", (_device_record_to_schema(record) for record in filtered)
     )
 
 
@@ -238,12 +293,12 @@ def list_owner_summaries() -> schemas.OwnersResponse:
     summaries = summarize_owner_records(records)
     return schemas.OwnersResponse(
         owners=[
-            schemas.OwnerSummary(
-                key=summary["key"],
-                display_name=summary["display_name"],
-                total_devices=summary["total_devices"],
-                locked_devices=summary["locked_devices"],
-                unlocked_devices=summary["unlocked_devices"],
+            schemas.OwnerSummary.model_construct(
+                key=summary.key,
+                display_name=summary.display_name,
+                total_devices=summary.total_devices,
+                locked_devices=summary.locked_devices,
+                unlocked_devices=summary.unlocked_devices,
             )
             for summary in summaries
         ]
@@ -354,7 +409,7 @@ def verify_owner(
     "/owners/{owner_key}/devices",
     response_model=schemas.DeviceListResponse,
 )
-def list_owner_devices(owner_key: str) -> schemas.DeviceListResponse:
+def list_owner_devices(owner_key: str) -> Response:
     owner_key_lower = owner_key.lower()
     owner_repo = get_owner_repository()
     owner_entry = owner_repo.get(owner_key_lower)
@@ -363,22 +418,14 @@ def list_owner_devices(owner_key: str) -> schemas.DeviceListResponse:
     except UniFiAPIError as exc:
         raise HTTPException(status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
-    filtered = [record for record in records if record["owner"] == owner_key_lower]
+    filtered = [record for record in records if record.owner == owner_key_lower]
     if not filtered and owner_entry is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Owner not found.")
 
-    return schemas.DeviceListResponse(
-        devices=[
-            schemas.DeviceStatus(
-                name=record["name"],
-                owner=record["owner"],
-                type=record["type"],
-                mac=record["mac"],
-                locked=record["locked"],
-                vendor=record["vendor"],
-            )
-            for record in filtered
-        ]
+    return _json_response(
+        schemas.DeviceListResponse.model_construct(
+            devices=[_device_record_to_schema(record) for record in filtered]
+        )
     )
 
 
@@ -408,24 +455,17 @@ def register_owner_device(
     record_event(
         action="device_registered",
         subject_type="device",
-        subject_id=record["mac"],
+        subject_id=record.mac,
         actor=actor,
         reason=reason,
         metadata={
-            "owner": record["owner"],
-            "type": record["type"],
-            "name": record["name"],
+            "owner": record.owner,
+            "type": record.type,
+            "name": record.name,
         },
     )
 
-    return schemas.DeviceStatus(
-        name=record["name"],
-        owner=record["owner"],
-        type=record["type"],
-        mac=record["mac"],
-        locked=record["locked"],
-        vendor=record["vendor"],
-    )
+    return _device_record_to_schema(record)
 
 
 @router.post(
@@ -451,7 +491,7 @@ def lock_devices(
         raise HTTPException(status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
     return schemas.DeviceActionResponse(
-        results=[schemas.DeviceActionResult(**result) for result in results]
+        results=[_action_result_to_schema(result) for result in results]
     )
 
 
@@ -499,7 +539,7 @@ def lock_owner_devices(
     return schemas.OwnerLockResponse(
         owner=owner_key_lower,
         processed=len(devices),
-        results=[schemas.DeviceActionResult(**result) for result in results],
+        results=[_action_result_to_schema(result) for result in results],
     )
 
 
@@ -507,14 +547,16 @@ def lock_owner_devices(
     "/clients/unregistered",
     response_model=schemas.UnregisteredClientsResponse,
 )
-def list_unregistered_clients() -> schemas.UnregisteredClientsResponse:
+def list_unregistered_clients() -> Response:
     try:
         clients = get_unregistered_client_records()
     except UniFiAPIError as exc:
         raise HTTPException(status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
-    return schemas.UnregisteredClientsResponse(
-        clients=[schemas.UnregisteredClient(**client) for client in clients]
+    return _json_response(
+        schemas.UnregisteredClientsResponse.model_construct(
+            clients=[_client_to_schema(client) for client in clients]
+        )
     )
 
 
@@ -546,7 +588,7 @@ def lock_unregistered_client(
         raise HTTPException(status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
     return schemas.DeviceActionResponse(
-        results=[schemas.DeviceActionResult(**result) for result in results]
+        results=[_action_result_to_schema(result) for result in results]
     )
 
 
@@ -563,11 +605,15 @@ def list_schedules(
     scope: Annotated[str | None, Query()] = None,
     owner: Annotated[str | None, Query()] = None,
     enabled: Annotated[bool | None, Query()] = None,
-) -> schemas.ScheduleListResponse:
+) -> Response:
     schedule_repo = get_schedule_repository()
     metadata = schedule_repo.get_metadata()
     schedules = schedule_repo.list(scope=scope, owner=owner, enabled=enabled)
-    return schemas.ScheduleListResponse(metadata=metadata, schedules=schedules)
+    return _json_response(
+        schemas.ScheduleListResponse.model_construct(
+            metadata=metadata, schedules=schedules
+        )
+    )
 
 
 @router.get(
@@ -697,7 +743,7 @@ def update_schedule(
 )
 def delete_schedule(schedule_id: str, request: Request) -> Response:
     schedule_repo = get_schedule_repository()
-    existing = schedule_repo.get(schedule_id)
+    existing = schedule_repo.get_summary(schedule_id)
     deleted = schedule_repo.delete(schedule_id)
     if not deleted:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Schedule not found.")
@@ -1000,9 +1046,9 @@ def get_session_identity(request: Request) -> schemas.WhoAmIResponse:
     if client_ip:
         normalized = client_ip.strip().lower()
         probable = [
-            schemas.UnregisteredClient(**client)
+            _client_to_schema(client)
             for client in clients
-            if isinstance(client.get("ip"), str) and client["ip"].strip().lower() == normalized
+            if isinstance(client.ip, str) and client.ip.strip().lower() == normalized
         ]
 
     if not forwarded_values and client_ip:
@@ -1101,13 +1147,15 @@ def disable_schedule(schedule_id: str, request: Request) -> schemas.DeviceSchedu
     response_model=schemas.OwnerScheduleResponse,
     tags=["schedules"],
 )
-def get_owner_schedules(owner_key: str) -> schemas.OwnerScheduleResponse:
+def get_owner_schedules(owner_key: str) -> Response:
     _require_owner(owner_key)
     schedule_repo = get_schedule_repository()
     owner_schedules, global_schedules = schedule_repo.list_for_owner(owner_key)
     metadata = schedule_repo.get_metadata()
-    return schemas.OwnerScheduleResponse(
-        metadata=metadata,
-        owner_schedules=owner_schedules,
-        global_schedules=global_schedules,
+    return _json_response(
+        schemas.OwnerScheduleResponse.model_construct(
+            metadata=metadata,
+            owner_schedules=owner_schedules,
+            global_schedules=global_schedules,
+        )
     )
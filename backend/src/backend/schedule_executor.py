@@ -197,6 +197,7 @@ def is_schedule_active(schedule: DeviceSchedule, now: datetime, tz: ZoneInfo) ->
 
 def _resolve_devices(schedule: DeviceSchedule) -> list[Device]:
     repo = get_device_repository()
+    owner_repo = get_owner_repository()
     devices = {device.mac: device for device in repo.list_all()}
     selected: dict[str, Device] = {}
 
@@ -225,7 +226,6 @@ def _resolve_devices(schedule: DeviceSchedule) -> list[Device]:
             for device in repo.list_by_owner(owner_key):
                 selected[device.mac] = device
             continue
-        owner_repo = get_owner_repository()
         if owner_repo.get(tag_norm):
             for device in repo.list_by_owner(tag_norm):
                 selected[device.mac] = device
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-import json
+import builtins
 import uuid
 from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from functools import lru_cache
-from typing import Iterable, Literal, Protocol
+from functools import cache
+from typing import Any, Literal, Protocol, cast
 
-from sqlalchemy import delete, select
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import Select, and_, bindparam, delete, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm import Session, load_only, selectinload
 
 from .database import get_engine, get_session_factory, is_database_configured
 from .db_models import (
@@ -37,40 +44,69 @@ from .schemas import (
 # Utility helpers
 # ---------------------------------------------------------------------------
 
+_DEFAULT_CONFIG = ScheduleConfig.model_validate(DEFAULT_SCHEDULE_CONFIG)
+
+# Stored JSON columns are encoded and validated directly by pydantic-core,
+# skipping the intermediate dict/json module round-trip.
+_EXCEPTIONS_ADAPTER = TypeAdapter(list[ScheduleException])
+
+
+def _dump_exceptions(exceptions: list[ScheduleException]) -> str:
+    return _EXCEPTIONS_ADAPTER.dump_json(exceptions, by_alias=True).decode()
+
 
 def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _schedule_to_model(schedule: DeviceSchedule) -> ScheduleModel:
+def _schedule_to_row(schedule: DeviceSchedule) -> dict[str, object]:
     primary_group = schedule.group_ids[0] if schedule.group_ids else None
-    return ScheduleModel(
-        id=schedule.id,
-        scope=schedule.scope,
-        owner_key=schedule.owner_key,
-        group_id=primary_group,
-        label=schedule.label,
-        description=schedule.description,
-        targets_json=json.dumps(
-            schedule.targets.model_dump(mode="json", by_alias=True)
-        ),
-        action=schedule.action,
-        end_action=schedule.end_action,
-        window_start=schedule.window.start.isoformat(),
-        window_end=schedule.window.end.isoformat(),
-        recurrence_json=json.dumps(
-            schedule.recurrence.model_dump(mode="json", by_alias=True)
-        ),
-        exceptions_json=json.dumps(
-            [
-                exception.model_dump(mode="json", by_alias=True)
-                for exception in schedule.exceptions
-            ]
-        ),
-        enabled=schedule.enabled,
-        created_at=schedule.created_at.isoformat(),
-        updated_at=schedule.updated_at.isoformat(),
-    )
+    return {
+        "id": schedule.id,
+        "scope": schedule.scope,
+        "owner_key": schedule.owner_key,
+        "group_id": primary_group,
+        "label": schedule.label,
+        "description": schedule.description,
+        "targets_json": schedule.targets.model_dump_json(by_alias=True),
+        "action": schedule.action,
+        "end_action": schedule.end_action,
+        "window_start": schedule.window.start.isoformat(),
+        "window_end": schedule.window.end.isoformat(),
+        "recurrence_json": schedule.recurrence.model_dump_json(by_alias=True),
+        "exceptions_json": _dump_exceptions(schedule.exceptions),
+        "enabled": schedule.enabled,
+        "created_at": schedule.created_at.isoformat(),
+        "updated_at": schedule.updated_at.isoformat(),
+    }
+
+
+def _clone_row_for_owner(
+    model: ScheduleModel, owner_key: str, timestamp: str
+) -> dict[str, object]:
+    """Copy a stored schedule row for another owner, reusing its JSON documents."""
+    return {
+        "id": str(uuid.uuid4()),
+        "scope": "owner",
+        "owner_key": owner_key.lower(),
+        "group_id": None,
+        "label": model.label,
+        "description": model.description,
+        "targets_json": model.targets_json,
+        "action": model.action,
+        "end_action": model.end_action,
+        "window_start": model.window_start,
+        "window_end": model.window_end,
+        "recurrence_json": model.recurrence_json,
+        "exceptions_json": model.exceptions_json,
+        "enabled": True,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+    }
+
+
+def _schedule_to_model(schedule: DeviceSchedule) -> ScheduleModel:
+    return ScheduleModel(**_schedule_to_row(schedule))
 
 
 def _model_to_schedule(
@@ -78,7 +114,8 @@ def _model_to_schedule(
     group_ids: Iterable[str] | None = None,
 ) -> DeviceSchedule:
     resolved_group_ids = list(group_ids or ([] if model.group_id is None else [model.group_id]))
-    return DeviceSchedule(
+    # Rows were validated on the way in; only the JSON documents still need parsing.
+    return DeviceSchedule.model_construct(
         id=model.id,
         scope=model.scope,
         owner_key=model.owner_key,
@@ -88,32 +125,34 @@ def _model_to_schedule(
         targets=ScheduleTarget.model_validate_json(model.targets_json),
         action=model.action,
         end_action=model.end_action,
-        window=ScheduleWindow(
+        window=ScheduleWindow.model_construct(
             start=datetime.fromisoformat(model.window_start),
             end=datetime.fromisoformat(model.window_end),
         ),
         recurrence=ScheduleRecurrence.model_validate_json(model.recurrence_json),
-        exceptions=[
-            ScheduleException.model_validate(exception)
-            for exception in json.loads(model.exceptions_json or "[]")
-        ],
+        exceptions=_EXCEPTIONS_ADAPTER.validate_json(model.exceptions_json or "[]"),
         enabled=bool(model.enabled),
         created_at=datetime.fromisoformat(model.created_at),
         updated_at=datetime.fromisoformat(model.updated_at),
     )
 
 
-def _clone_for_owner(schedule: DeviceSchedule, owner_key: str) -> DeviceSchedule:
-    cloned = DeviceSchedule.model_validate(schedule.model_dump(by_alias=True))
-    cloned.id = str(uuid.uuid4())
-    cloned.scope = "owner"
-    cloned.owner_key = owner_key.lower()
-    cloned.group_ids = []
-    cloned.enabled = True
-    timestamp = _now()
-    cloned.created_at = timestamp
-    cloned.updated_at = timestamp
-    return cloned
+def _clone_for_owner(
+    schedule: DeviceSchedule, owner_key: str, timestamp: datetime | None = None
+) -> DeviceSchedule:
+    # Nested documents are never edited in place, so the clone can share them.
+    timestamp = timestamp or _now()
+    return schedule.model_copy(
+        update={
+            "id": str(uuid.uuid4()),
+            "scope": "owner",
+            "owner_key": owner_key.lower(),
+            "group_ids": [],
+            "enabled": True,
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
+    )
 
 
 @dataclass
@@ -127,6 +166,25 @@ class ScheduleGroupRecord:
     updated_at: datetime
 
 
+@dataclass
+class ScheduleSummaryRecord:
+    id: str
+    label: str
+    scope: str
+    owner_key: str | None
+    enabled: bool
+
+
+def _to_summary(schedule: DeviceSchedule | ScheduleModel) -> ScheduleSummaryRecord:
+    return ScheduleSummaryRecord(
+        id=schedule.id,
+        label=schedule.label,
+        scope=schedule.scope,
+        owner_key=schedule.owner_key,
+        enabled=bool(schedule.enabled),
+    )
+
+
 def _metadata_to_model(metadata: ScheduleMetadata) -> ScheduleMetadataModel:
     return ScheduleMetadataModel(
         id=1,
@@ -142,35 +200,32 @@ def _model_to_metadata(model: ScheduleMetadataModel) -> ScheduleMetadata:
     )
 
 
+def _lower_or_none(value: str | None) -> str | None:
+    return value.lower() if value else None
+
+
+# Field name -> converter applied before assignment (None keeps the value as-is).
+_UPDATE_CONVERTERS: dict[str, Callable[[Any], Any] | None] = {
+    "scope": None,
+    "owner_key": _lower_or_none,
+    "label": None,
+    "description": None,
+    "targets": ScheduleTarget.model_validate,
+    "action": None,
+    "end_action": None,
+    "window": ScheduleWindow.model_validate,
+    "recurrence": ScheduleRecurrence.model_validate,
+    "exceptions": _EXCEPTIONS_ADAPTER.validate_python,
+    "enabled": None,
+    "group_ids": lambda value: list(value or []),
+}
+
+
 def _apply_update(schedule: DeviceSchedule, update: ScheduleUpdateRequest) -> DeviceSchedule:
-    data = update.model_dump(exclude_unset=True, by_alias=True)
-    if "scope" in data:
-        schedule.scope = data["scope"]
-    if "ownerKey" in data:
-        schedule.owner_key = data["ownerKey"].lower() if data["ownerKey"] else None
-    if "label" in data:
-        schedule.label = data["label"]
-    if "description" in data:
-        schedule.description = data["description"]
-    if "targets" in data:
-        schedule.targets = ScheduleTarget.model_validate(data["targets"])
-    if "action" in data:
-        schedule.action = data["action"]
-    if "endAction" in data:
-        schedule.end_action = data["endAction"]
-    if "window" in data:
-        schedule.window = ScheduleWindow.model_validate(data["window"])
-    if "recurrence" in data:
-        schedule.recurrence = ScheduleRecurrence.model_validate(data["recurrence"])
-    if "exceptions" in data:
-        schedule.exceptions = [
-            ScheduleException.model_validate(exception)
-            for exception in data["exceptions"]
-        ]
-    if "enabled" in data:
-        schedule.enabled = data["enabled"]
-    if "groupIds" in data:
-        schedule.group_ids = list(data["groupIds"] or [])
+    for field in update.model_fields_set:
+        value = getattr(update, field)
+        converter = _UPDATE_CONVERTERS[field]
+        setattr(schedule, field, converter(value) if converter else value)
     return schedule
 
 
@@ -182,6 +237,8 @@ def _apply_update(schedule: DeviceSchedule, update: ScheduleUpdateRequest) -> De
 class ScheduleRepository(Protocol):
     """Abstraction used by routers/services to manage schedules."""
 
+    __slots__ = ()
+
     def list(
         self,
         *,
@@ -191,9 +248,30 @@ class ScheduleRepository(Protocol):
     ) -> list[DeviceSchedule]:
         ...
 
+    def iter_list(
+        self,
+        *,
+        scope: str | None = None,
+        owner: str | None = None,
+        enabled: bool | None = None,
+    ) -> Iterator[DeviceSchedule]:
+        ...
+
     def get(self, schedule_id: str) -> DeviceSchedule | None:
         ...
 
+    def list_summary(
+        self,
+        *,
+        scope: str | None = None,
+        owner: str | None = None,
+        enabled: bool | None = None,
+    ) -> builtins.list[ScheduleSummaryRecord]:
+        ...
+
+    def get_summary(self, schedule_id: str) -> ScheduleSummaryRecord | None:
+        ...
+
     def create(self, payload: ScheduleCreateRequest) -> DeviceSchedule:
         ...
 
@@ -208,7 +286,9 @@ class ScheduleRepository(Protocol):
     def set_enabled(self, schedule_id: str, enabled: bool) -> DeviceSchedule | None:
         ...
 
-    def list_for_owner(self, owner_key: str) -> tuple[list[DeviceSchedule], list[DeviceSchedule]]:
+    def list_for_owner(
+        self, owner_key: str
+    ) -> tuple[builtins.list[DeviceSchedule], builtins.list[DeviceSchedule]]:
         ...
 
     def get_metadata(self) -> ScheduleMetadata:
@@ -226,15 +306,17 @@ class ScheduleRepository(Protocol):
         target_owner: str,
         *,
         mode: Literal["merge", "replace"],
-    ) -> tuple[list[DeviceSchedule], int]:
+    ) -> tuple[builtins.list[DeviceSchedule], int]:
         ...
 
     def list_groups(
         self, owner_key: str | None = None
-    ) -> list[tuple[ScheduleGroupRecord, list[DeviceSchedule]]]:
+    ) -> builtins.list[tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]]]:
         ...
 
-    def get_group(self, group_id: str) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]] | None:
+    def get_group(
+        self, group_id: str
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]] | None:
         ...
 
     def create_group(
@@ -243,9 +325,9 @@ class ScheduleRepository(Protocol):
         *,
         owner_key: str | None,
         description: str | None,
-        schedule_ids: list[str],
+        schedule_ids: builtins.list[str],
         is_active: bool,
-    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]]:
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]]:
         ...
 
     def update_group(
@@ -254,9 +336,9 @@ class ScheduleRepository(Protocol):
         *,
         name: str | None = None,
         description: str | None = None,
-        schedule_ids: list[str] | None = None,
+        schedule_ids: builtins.list[str] | None = None,
         is_active: bool | None = None,
-    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]] | None:
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]] | None:
         ...
 
     def delete_group(self, group_id: str) -> bool:
@@ -266,7 +348,7 @@ class ScheduleRepository(Protocol):
         self,
         group_id: str,
         active: bool,
-    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]] | None:
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]] | None:
         ...
 
 
@@ -276,31 +358,73 @@ class ScheduleRepository(Protocol):
 
 
 class InMemoryScheduleRepository(ScheduleRepository):
+    __slots__ = (
+        "_config",
+        "_groups",
+        "_memberships",
+        "_schedule_memberships",
+        "_schedule_index",
+        "_owner_positions",
+        "_global_positions",
+    )
+
     def __init__(self) -> None:
-        self._config = ScheduleConfig.model_validate(DEFAULT_SCHEDULE_CONFIG)
+        # Stored schedules are copy-on-write, so the parsed defaults can be shared.
+        self._config = _DEFAULT_CONFIG.model_copy(
+            update={"schedules": list(_DEFAULT_CONFIG.schedules)}
+        )
         self._groups: dict[str, ScheduleGroupRecord] = {}
         self._memberships: dict[str, set[str]] = defaultdict(set)
         self._schedule_memberships: dict[str, set[str]] = defaultdict(set)
+        self._schedule_index: dict[str, int] = {}
+        # Positions of owner-scoped schedules per owner, and of global schedules.
+        self._owner_positions: dict[str | None, list[int]] = defaultdict(list)
+        self._global_positions: list[int] = []
         self._initialise_from_config()
 
     def _initialise_from_config(self) -> None:
+        self._reindex()
         self._memberships.clear()
         self._schedule_memberships.clear()
         for schedule in self._config.schedules:
-            schedule.group_ids = list(schedule.group_ids or [])
             for group_id in schedule.group_ids:
                 self._memberships[group_id].add(schedule.id)
                 self._schedule_memberships[schedule.id].add(group_id)
         self._enforce_activation()
 
-    def _clone_schedule(self, schedule: DeviceSchedule) -> DeviceSchedule:
-        return DeviceSchedule.model_validate(schedule.model_dump(by_alias=True))
+    def _replace_schedule(self, schedule: DeviceSchedule, **changes: Any) -> None:
+        # Stored schedules are copy-on-write: edits swap in a shallow copy, so
+        # instances already handed to callers never change underneath them.
+        index = self._schedule_index[schedule.id]
+        self._config.schedules[index] = schedule.model_copy(update=changes)
 
-    def _find_schedule_index(self, schedule_id: str) -> int | None:
+    def _reindex(self) -> None:
+        self._schedule_index.clear()
+        self._owner_positions.clear()
+        self._global_positions.clear()
         for index, schedule in enumerate(self._config.schedules):
-            if schedule.id == schedule_id:
-                return index
-        return None
+            # First occurrence wins, matching the old linear scan.
+            self._schedule_index.setdefault(schedule.id, index)
+            self._index_scope(schedule, index)
+
+    def _index_scope(self, schedule: DeviceSchedule, index: int) -> None:
+        if schedule.scope == "global":
+            self._global_positions.append(index)
+        else:
+            self._owner_positions[schedule.owner_key].append(index)
+
+    def _append_schedule(self, schedule: DeviceSchedule) -> None:
+        index = len(self._config.schedules)
+        self._schedule_index.setdefault(schedule.id, index)
+        self._index_scope(schedule, index)
+        self._config.schedules.append(schedule)
+
+    def _owner_schedules(self, owner_key: str) -> list[DeviceSchedule]:
+        schedules = self._config.schedules
+        return [schedules[index] for index in self._owner_positions.get(owner_key, ())]
+
+    def _find_schedule_index(self, schedule_id: str) -> int | None:
+        return self._schedule_index.get(schedule_id)
 
     def _find_schedule(self, schedule_id: str) -> DeviceSchedule | None:
         index = self._find_schedule_index(schedule_id)
@@ -311,16 +435,21 @@ class InMemoryScheduleRepository(ScheduleRepository):
     def _set_schedule(self, schedule: DeviceSchedule) -> None:
         index = self._find_schedule_index(schedule.id)
         if index is None:
-            self._config.schedules.append(schedule)
-        else:
-            self._config.schedules[index] = schedule
+            self._append_schedule(schedule)
+            return
+        previous = self._config.schedules[index]
+        self._config.schedules[index] = schedule
+        if (previous.scope, previous.owner_key) != (schedule.scope, schedule.owner_key):
+            self._reindex()
 
     def _touch_generated(self) -> None:
-        self._config.metadata.generated_at = _now()
+        self._config.metadata = self._config.metadata.model_copy(
+            update={"generated_at": _now()}
+        )
 
     def _collect_group_schedules(self, group_id: str) -> list[DeviceSchedule]:
         return [
-            self._clone_schedule(schedule)
+            schedule
             for schedule in self._config.schedules
             if group_id in self._schedule_memberships.get(schedule.id, set())
         ]
@@ -332,8 +461,9 @@ class InMemoryScheduleRepository(ScheduleRepository):
         if group.owner_key and schedule.owner_key and schedule.owner_key != group.owner_key:
             raise ValueError("Schedule owner does not match group owner.")
         if group.id not in schedule.group_ids:
-            schedule.group_ids.append(group.id)
-            schedule.updated_at = _now()
+            self._replace_schedule(
+                schedule, group_ids=[*schedule.group_ids, group.id], updated_at=_now()
+            )
         self._memberships[group.id].add(schedule.id)
         self._schedule_memberships[schedule.id].add(group.id)
 
@@ -342,8 +472,11 @@ class InMemoryScheduleRepository(ScheduleRepository):
         if schedule is None:
             return
         if group.id in schedule.group_ids:
-            schedule.group_ids.remove(group.id)
-            schedule.updated_at = _now()
+            self._replace_schedule(
+                schedule,
+                group_ids=[gid for gid in schedule.group_ids if gid != group.id],
+                updated_at=_now(),
+            )
         self._memberships[group.id].discard(schedule_id)
         if schedule.id in self._schedule_memberships:
             self._schedule_memberships[schedule.id].discard(group.id)
@@ -372,13 +505,15 @@ class InMemoryScheduleRepository(ScheduleRepository):
         for group_id in active_groups:
             active_schedule_ids.update(self._memberships.get(group_id, set()))
         managed_schedule_ids = set(self._schedule_memberships.keys())
-        for schedule in self._config.schedules:
+        schedules = self._config.schedules
+        for index, schedule in enumerate(schedules):
             if schedule.id not in managed_schedule_ids:
                 continue
             should_enable = schedule.id in active_schedule_ids
             if schedule.enabled != should_enable:
-                schedule.enabled = should_enable
-                schedule.updated_at = now
+                schedules[index] = schedule.model_copy(
+                    update={"enabled": should_enable, "updated_at": now}
+                )
 
     # Schedule CRUD ---------------------------------------------------
 
@@ -389,23 +524,48 @@ class InMemoryScheduleRepository(ScheduleRepository):
         owner: str | None = None,
         enabled: bool | None = None,
     ) -> list[DeviceSchedule]:
-        schedules = [
-            self._clone_schedule(schedule) for schedule in self._config.schedules
-        ]
-        if scope:
-            schedules = [s for s in schedules if s.scope == scope]
-        if owner:
-            schedules = [s for s in schedules if s.owner_key == owner]
-        if enabled is not None:
-            schedules = [s for s in schedules if s.enabled is enabled]
-        return schedules
+        return list(self.iter_list(scope=scope, owner=owner, enabled=enabled))
+
+    def iter_list(
+        self,
+        *,
+        scope: str | None = None,
+        owner: str | None = None,
+        enabled: bool | None = None,
+    ) -> Iterator[DeviceSchedule]:
+        return (
+            schedule
+            for schedule in self._config.schedules
+            if (not scope or schedule.scope == scope)
+            and (not owner or schedule.owner_key == owner)
+            and (enabled is None or schedule.enabled is enabled)
+        )
 
     def get(self, schedule_id: str) -> DeviceSchedule | None:
+        return self._find_schedule(schedule_id)
+
+    def list_summary(
+        self,
+        *,
+        scope: str | None = None,
+        owner: str | None = None,
+        enabled: bool | None = None,
+    ) -> builtins.list[ScheduleSummaryRecord]:
+        return [
+            _to_summary(schedule)
+            for schedule in self._config.schedules
+            if (not scope or schedule.scope == scope)
+            and (not owner or schedule.owner_key == owner)
+            and (enabled is None or schedule.enabled is enabled)
+        ]
+
+    def get_summary(self, schedule_id: str) -> ScheduleSummaryRecord | None:
         schedule = self._find_schedule(schedule_id)
-        return self._clone_schedule(schedule) if schedule else None
+        return _to_summary(schedule) if schedule else None
 
     def create(self, payload: ScheduleCreateRequest) -> DeviceSchedule:
         owner = payload.owner_key.lower() if payload.owner_key else None
+        now = _now()
         schedule = DeviceSchedule(
             id=str(uuid.uuid4()),
             scope=payload.scope,
@@ -420,10 +580,10 @@ class InMemoryScheduleRepository(ScheduleRepository):
             recurrence=payload.recurrence,
             exceptions=list(payload.exceptions or []),
             enabled=payload.enabled if payload.enabled is not None else True,
-            created_at=_now(),
-            updated_at=_now(),
+            created_at=now,
+            updated_at=now,
         )
-        self._config.schedules.append(schedule)
+        self._append_schedule(schedule)
         group_ids = list(payload.group_ids or [])
         for group_id in group_ids:
             group = self._groups.get(group_id)
@@ -432,7 +592,7 @@ class InMemoryScheduleRepository(ScheduleRepository):
             self._add_membership(group, schedule.id)
         self._touch_generated()
         self._enforce_activation()
-        return self._clone_schedule(schedule)
+        return self._find_schedule(schedule.id)  # type: ignore[return-value]
 
     def update(
         self, schedule_id: str, payload: ScheduleUpdateRequest
@@ -440,7 +600,7 @@ class InMemoryScheduleRepository(ScheduleRepository):
         schedule = self._find_schedule(schedule_id)
         if schedule is None:
             return None
-        updated = _apply_update(self._clone_schedule(schedule), payload)
+        updated = _apply_update(schedule.model_copy(), payload)
         updated.updated_at = _now()
         if payload.group_ids is not None:
             desired = set(payload.group_ids)
@@ -458,13 +618,14 @@ class InMemoryScheduleRepository(ScheduleRepository):
         self._set_schedule(updated)
         self._touch_generated()
         self._enforce_activation()
-        return self._clone_schedule(updated)
+        return self._find_schedule(schedule_id)
 
     def delete(self, schedule_id: str) -> bool:
         index = self._find_schedule_index(schedule_id)
         if index is None:
             return False
         self._config.schedules.pop(index)
+        self._reindex()
         for group_id in list(self._schedule_memberships.get(schedule_id, set())):
             group = self._groups.get(group_id)
             if group:
@@ -478,36 +639,29 @@ class InMemoryScheduleRepository(ScheduleRepository):
         schedule = self._find_schedule(schedule_id)
         if schedule is None:
             return None
-        schedule.enabled = enabled
-        schedule.updated_at = _now()
+        self._replace_schedule(schedule, enabled=enabled, updated_at=_now())
         self._touch_generated()
         self._enforce_activation()
-        return self._clone_schedule(schedule)
+        return self._find_schedule(schedule_id)
 
     def list_for_owner(
         self, owner_key: str
-    ) -> tuple[list[DeviceSchedule], list[DeviceSchedule]]:
-        owner_schedules = [
-            self._clone_schedule(schedule)
-            for schedule in self._config.schedules
-            if schedule.scope == "owner" and schedule.owner_key == owner_key
-        ]
-        global_schedules = [
-            self._clone_schedule(schedule)
-            for schedule in self._config.schedules
-            if schedule.scope == "global"
-        ]
-        return owner_schedules, global_schedules
+    ) -> tuple[builtins.list[DeviceSchedule], builtins.list[DeviceSchedule]]:
+        schedules = self._config.schedules
+        return (
+            self._owner_schedules(owner_key),
+            [schedules[index] for index in self._global_positions],
+        )
 
     def get_metadata(self) -> ScheduleMetadata:
-        return ScheduleMetadata.model_validate(
-            self._config.metadata.model_dump(by_alias=True)
-        )
+        return self._config.metadata
 
     def sync_from_config(self, config: ScheduleConfig, *, replace: bool) -> None:
+        # The config is already validated; shallow copies detach it from the caller.
         if replace:
-            self._config = ScheduleConfig.model_validate(
-                config.model_dump(by_alias=True)
+            self._config = ScheduleConfig.model_construct(
+                metadata=config.metadata,
+                schedules=[schedule.model_copy() for schedule in config.schedules],
             )
             self._groups.clear()
         else:
@@ -515,12 +669,8 @@ class InMemoryScheduleRepository(ScheduleRepository):
             for schedule in config.schedules:
                 if schedule.id in existing_ids:
                     continue
-                self._config.schedules.append(
-                    DeviceSchedule.model_validate(schedule.model_dump(by_alias=True))
-                )
-        self._config.metadata = ScheduleMetadata.model_validate(
-            config.metadata.model_dump(by_alias=True)
-        )
+                self._config.schedules.append(schedule.model_copy())
+        self._config.metadata = config.metadata.model_copy()
         self._initialise_from_config()
 
     def clone(self, schedule_id: str, target_owner: str) -> DeviceSchedule | None:
@@ -528,9 +678,9 @@ class InMemoryScheduleRepository(ScheduleRepository):
         if schedule is None:
             return None
         clone = _clone_for_owner(schedule, target_owner.lower())
-        self._config.schedules.append(clone)
+        self._append_schedule(clone)
         self._touch_generated()
-        return self._clone_schedule(clone)
+        return clone
 
     def copy_owner_schedules(
         self,
@@ -538,14 +688,10 @@ class InMemoryScheduleRepository(ScheduleRepository):
         target_owner: str,
         *,
         mode: Literal["merge", "replace"],
-    ) -> tuple[list[DeviceSchedule], int]:
+    ) -> tuple[builtins.list[DeviceSchedule], int]:
         source_owner = source_owner.lower()
         target_owner = target_owner.lower()
-        source_schedules = [
-            schedule
-            for schedule in self._config.schedules
-            if schedule.scope == "owner" and schedule.owner_key == source_owner
-        ]
+        source_schedules = self._owner_schedules(source_owner)
         if not source_schedules:
             return [], 0
 
@@ -562,12 +708,14 @@ class InMemoryScheduleRepository(ScheduleRepository):
                     continue
                 remaining.append(schedule)
             self._config.schedules = remaining
+            self._reindex()
 
         created: list[DeviceSchedule] = []
+        now = _now()
         for schedule in source_schedules:
-            clone = _clone_for_owner(schedule, target_owner)
-            self._config.schedules.append(clone)
-            created.append(self._clone_schedule(clone))
+            clone = _clone_for_owner(schedule, target_owner, now)
+            self._append_schedule(clone)
+            created.append(clone)
 
         if created or replaced_count:
             self._touch_generated()
@@ -578,7 +726,7 @@ class InMemoryScheduleRepository(ScheduleRepository):
 
     def list_groups(
         self, owner_key: str | None = None
-    ) -> list[tuple[ScheduleGroupRecord, list[DeviceSchedule]]]:
+    ) -> builtins.list[tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]]]:
         groups = [
             group
             for group in self._groups.values()
@@ -589,7 +737,9 @@ class InMemoryScheduleRepository(ScheduleRepository):
             for group in groups
         ]
 
-    def get_group(self, group_id: str) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]] | None:
+    def get_group(
+        self, group_id: str
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]] | None:
         group = self._groups.get(group_id)
         if group is None:
             return None
@@ -601,9 +751,9 @@ class InMemoryScheduleRepository(ScheduleRepository):
         *,
         owner_key: str | None,
         description: str | None,
-        schedule_ids: list[str],
+        schedule_ids: builtins.list[str],
         is_active: bool,
-    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]]:
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]]:
         group_id = str(uuid.uuid4())
         now = _now()
         record = ScheduleGroupRecord(
@@ -631,9 +781,9 @@ class InMemoryScheduleRepository(ScheduleRepository):
         *,
         name: str | None = None,
         description: str | None = None,
-        schedule_ids: list[str] | None = None,
+        schedule_ids: builtins.list[str] | None = None,
         is_active: bool | None = None,
-    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]] | None:
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]] | None:
         group = self._groups.get(group_id)
         if group is None:
             return None
@@ -677,7 +827,7 @@ class InMemoryScheduleRepository(ScheduleRepository):
         self,
         group_id: str,
         active: bool,
-    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]] | None:
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]] | None:
         group = self._groups.get(group_id)
         if group is None:
             return None
@@ -697,26 +847,181 @@ class InMemoryScheduleRepository(ScheduleRepository):
 # ---------------------------------------------------------------------------
 
 
+# Statements are built once so SQLAlchemy's compiled cache is hit directly and
+# per-call work is limited to binding parameters.
+_OWNER_SCHEDULES_STMT = select(ScheduleModel).where(
+    ScheduleModel.scope == "owner",
+    ScheduleModel.owner_key == bindparam("owner_key"),
+)
+_OWNER_AND_GLOBAL_SCHEDULES_STMT = select(ScheduleModel).where(
+    or_(
+        and_(
+            ScheduleModel.scope == "owner",
+            ScheduleModel.owner_key == bindparam("owner_key"),
+        ),
+        ScheduleModel.scope == "global",
+    )
+)
+_DELETE_OWNER_MEMBERSHIPS_STMT = delete(ScheduleGroupMembershipModel).where(
+    ScheduleGroupMembershipModel.schedule_id.in_(
+        select(ScheduleModel.id).where(
+            ScheduleModel.scope == "owner",
+            ScheduleModel.owner_key == bindparam("owner_key"),
+        )
+    )
+)
+_DELETE_OWNER_SCHEDULES_STMT = delete(ScheduleModel).where(
+    ScheduleModel.scope == "owner",
+    ScheduleModel.owner_key == bindparam("owner_key"),
+)
+# Children first so the foreign keys never dangle mid-transaction.
+_CLEAR_SCHEDULE_TABLES_STMTS = (
+    delete(ScheduleGroupMembershipModel),
+    delete(ScheduleModel),
+    delete(ScheduleGroupModel),
+)
+# Dialects that can skip existing ids server-side, sparing the id pre-fetch.
+_INSERT_MISSING_SCHEDULES_STMTS = {
+    "sqlite": sqlite_insert(ScheduleModel).on_conflict_do_nothing(
+        index_elements=[ScheduleModel.id]
+    ),
+    "postgresql": postgresql_insert(ScheduleModel).on_conflict_do_nothing(
+        index_elements=[ScheduleModel.id]
+    ),
+}
+_SCHEDULES_BY_ID_STMT = select(ScheduleModel).where(
+    ScheduleModel.id.in_(bindparam("schedule_ids", expanding=True))
+)
+_SCHEDULE_GROUP_MAP_STMT = (
+    select(
+        ScheduleGroupMembershipModel.schedule_id,
+        ScheduleGroupMembershipModel.group_id,
+    )
+    .where(
+        ScheduleGroupMembershipModel.schedule_id.in_(
+            bindparam("schedule_ids", expanding=True)
+        )
+    )
+    .order_by(ScheduleGroupMembershipModel.group_id)
+)
+_GROUP_SCHEDULE_IDS_STMT = select(ScheduleGroupMembershipModel.schedule_id).where(
+    ScheduleGroupMembershipModel.group_id == bindparam("group_id")
+)
+_GROUP_SCHEDULES_STMT = (
+    select(ScheduleModel)
+    .join(
+        ScheduleGroupMembershipModel,
+        ScheduleGroupMembershipModel.schedule_id == ScheduleModel.id,
+    )
+    .where(ScheduleGroupMembershipModel.group_id == bindparam("group_id"))
+)
+# Summary reads skip the JSON document columns entirely.
+_SUMMARY_LOAD = load_only(
+    ScheduleModel.id,
+    ScheduleModel.label,
+    ScheduleModel.scope,
+    ScheduleModel.owner_key,
+    ScheduleModel.enabled,
+)
+_TOUCH_METADATA_STMT = (
+    update(ScheduleMetadataModel)
+    .where(ScheduleMetadataModel.id == 1)
+    .values(generated_at=bindparam("generated_at"))
+)
+_GROUPS_BY_OWNER_STMT = (
+    select(ScheduleGroupModel)
+    .options(selectinload(ScheduleGroupModel.schedules))
+    .where(ScheduleGroupModel.owner_key == bindparam("owner_key"))
+)
+_GLOBAL_GROUPS_STMT = (
+    select(ScheduleGroupModel)
+    .options(selectinload(ScheduleGroupModel.schedules))
+    .where(ScheduleGroupModel.owner_key.is_(None))
+)
+
+
+@cache
+def _list_schedules_stmt(
+    by_scope: bool, by_owner: bool, by_enabled: bool
+) -> Select[Any]:
+    stmt = select(ScheduleModel)
+    if by_scope:
+        stmt = stmt.where(ScheduleModel.scope == bindparam("scope"))
+    if by_owner:
+        stmt = stmt.where(ScheduleModel.owner_key == bindparam("owner"))
+    if by_enabled:
+        stmt = stmt.where(ScheduleModel.enabled == bindparam("enabled"))
+    return stmt
+
+
+_LIST_BATCH_SIZE = 256
+
+# Reads served by get()/list_for_owner()/get_metadata() are memoised only for the
+# lifetime of one request, so writes from other workers are seen by the next
+# request. Writes made through the repository drop the current request's entries.
+_request_read_cache: ContextVar[dict[tuple[str, str], Any] | None] = ContextVar(
+    "schedule_read_cache", default=None
+)
+
+
+@contextmanager
+def schedule_read_scope() -> Iterator[None]:
+    """Memoise SQL schedule reads until the block exits (one API request)."""
+    token = _request_read_cache.set({})
+    try:
+        yield
+    finally:
+        _request_read_cache.reset(token)
+
+
 class SqlScheduleRepository(ScheduleRepository):
+    __slots__ = ("_session_factory",)
+
     def __init__(self) -> None:
         self._session_factory = get_session_factory()
 
     def _session(self) -> Session:
         return self._session_factory()
 
+    def _cached_read[T](self, key: tuple[str, str], loader: Callable[[], T]) -> T:
+        cache = _request_read_cache.get()
+        if cache is None:
+            return loader()
+        if key not in cache:
+            cache[key] = loader()
+        return cache[key]
+
+    def _commit(self, session: Session) -> None:
+        session.commit()
+        cache = _request_read_cache.get()
+        if cache is not None:
+            cache.clear()
+
     def _get_metadata(self, session: Session) -> ScheduleMetadata:
         metadata_row = session.execute(select(ScheduleMetadataModel)).scalar_one_or_none()
         if metadata_row is None:
-            metadata = ScheduleMetadata.model_validate(DEFAULT_SCHEDULE_CONFIG["metadata"])
-            session.merge(_metadata_to_model(metadata))
-            session.commit()
+            metadata = _DEFAULT_CONFIG.metadata
+            session.add(_metadata_to_model(metadata))
+            self._commit(session)
             return metadata
         return _model_to_metadata(metadata_row)
 
     def _set_generated_at(self, session: Session) -> None:
-        metadata = self._get_metadata(session)
-        metadata.generated_at = _now()
-        session.merge(_metadata_to_model(metadata))
+        # A single UPDATE rides along with the write's own flush at commit time.
+        generated_at = _now()
+        result = cast(
+            CursorResult[Any],
+            session.execute(
+                _TOUCH_METADATA_STMT,
+                {"generated_at": generated_at.isoformat()},
+                execution_options={"synchronize_session": False},
+            ),
+        )
+        if result.rowcount == 0:
+            metadata = _DEFAULT_CONFIG.metadata.model_copy(
+                update={"generated_at": generated_at}
+            )
+            session.add(_metadata_to_model(metadata))
 
     def _model_to_group_record(self, model: ScheduleGroupModel) -> ScheduleGroupRecord:
         return ScheduleGroupRecord(
@@ -736,23 +1041,50 @@ class SqlScheduleRepository(ScheduleRepository):
         if not schedule_ids:
             return {}
         rows = session.execute(
-            select(
-                ScheduleGroupMembershipModel.schedule_id,
-                ScheduleGroupMembershipModel.group_id,
-            ).where(ScheduleGroupMembershipModel.schedule_id.in_(schedule_ids))
+            _SCHEDULE_GROUP_MAP_STMT, {"schedule_ids": schedule_ids}
         ).all()
+        # Rows arrive ordered by group id, so each list is already sorted.
         mapping: dict[str, list[str]] = defaultdict(list)
         for schedule_id, group_id in rows:
             mapping[schedule_id].append(group_id)
-        for group_list in mapping.values():
-            group_list.sort()
         return mapping
 
+    def _schedules_by_id(
+        self, session: Session, schedule_ids: Iterable[str]
+    ) -> dict[str, ScheduleModel]:
+        schedule_ids = list(schedule_ids)
+        if not schedule_ids:
+            return {}
+        rows = session.execute(
+            _SCHEDULES_BY_ID_STMT, {"schedule_ids": schedule_ids}
+        ).scalars()
+        return {row.id: row for row in rows}
+
+    def _group_result(
+        self,
+        session: Session,
+        group: ScheduleGroupModel,
+        schedule_rows: Iterable[ScheduleModel] | None = None,
+    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]]:
+        if schedule_rows is None:
+            schedule_rows = session.execute(
+                _GROUP_SCHEDULES_STMT, {"group_id": group.id}
+            ).scalars()
+        schedule_rows = list(schedule_rows)
+        memberships = self._schedule_group_map(
+            session, [row.id for row in schedule_rows]
+        )
+        return (
+            self._model_to_group_record(group),
+            [
+                _model_to_schedule(row, memberships.get(row.id, []))
+                for row in schedule_rows
+            ],
+        )
+
     def _group_schedule_ids(self, session: Session, group_id: str) -> list[str]:
         rows = session.execute(
-            select(ScheduleGroupMembershipModel.schedule_id).where(
-                ScheduleGroupMembershipModel.group_id == group_id
-            )
+            _GROUP_SCHEDULE_IDS_STMT, {"group_id": group_id}
         ).scalars()
         return list(rows)
 
@@ -769,7 +1101,7 @@ class SqlScheduleRepository(ScheduleRepository):
             schedule_id=schedule.id,
             created_at=_now().isoformat(),
         )
-        session.merge(membership)
+        session.add(membership)
         session.flush()
         self._refresh_primary_group(session, schedule.id)
 
@@ -796,6 +1128,9 @@ class SqlScheduleRepository(ScheduleRepository):
         schedule.updated_at = _now().isoformat()
 
     def _enforce_activation_sql(self, session: Session) -> None:
+        # Sessions don't autoflush, and the active flags and memberships are read
+        # back with SQL below, so pending changes must reach the database first.
+        session.flush()
         stmt = select(ScheduleGroupModel.id).where(
             ScheduleGroupModel.is_active.is_(True)
         )
@@ -828,15 +1163,17 @@ class SqlScheduleRepository(ScheduleRepository):
     def _activate_group_sql(self, session: Session, group: ScheduleGroupModel) -> None:
         now_iso = _now().isoformat()
         owner_key = group.owner_key
-        stmt = select(ScheduleGroupModel).where(ScheduleGroupModel.id != group.id)
+        stmt = select(ScheduleGroupModel).where(
+            ScheduleGroupModel.id != group.id,
+            ScheduleGroupModel.is_active.is_(True),
+        )
         if owner_key is None:
             stmt = stmt.where(ScheduleGroupModel.owner_key.is_(None))
         else:
             stmt = stmt.where(ScheduleGroupModel.owner_key == owner_key)
         for other in session.execute(stmt).scalars():
-            if other.is_active:
-                other.is_active = False
-                other.updated_at = now_iso
+            other.is_active = False
+            other.updated_at = now_iso
         if not group.is_active:
             group.is_active = True
             group.updated_at = now_iso
@@ -851,19 +1188,33 @@ class SqlScheduleRepository(ScheduleRepository):
         owner: str | None = None,
         enabled: bool | None = None,
     ) -> list[DeviceSchedule]:
+        return list(self.iter_list(scope=scope, owner=owner, enabled=enabled))
+
+    def iter_list(
+        self,
+        *,
+        scope: str | None = None,
+        owner: str | None = None,
+        enabled: bool | None = None,
+    ) -> Iterator[DeviceSchedule]:
+        stmt = _list_schedules_stmt(bool(scope), bool(owner), enabled is not None)
+        params = {"scope": scope, "owner": owner, "enabled": enabled}
         with self._session() as session:
-            stmt = select(ScheduleModel)
-            if scope:
-                stmt = stmt.where(ScheduleModel.scope == scope)
-            if owner:
-                stmt = stmt.where(ScheduleModel.owner_key == owner)
-            if enabled is not None:
-                stmt = stmt.where(ScheduleModel.enabled == enabled)
-            rows = session.execute(stmt).scalars().all()
-            memberships = self._schedule_group_map(session, [row.id for row in rows])
-            return [_model_to_schedule(row, memberships.get(row.id, [])) for row in rows]
+            result = session.execute(stmt, params).yield_per(_LIST_BATCH_SIZE)
+            # Memberships are resolved per batch so only one batch is held at a time.
+            for rows in result.scalars().partitions():
+                memberships = self._schedule_group_map(session, [row.id for row in rows])
+                for row in rows:
+                    yield _model_to_schedule(row, memberships.get(row.id, []))
 
     def get(self, schedule_id: str) -> DeviceSchedule | None:
+        schedule = self._cached_read(
+            ("get", schedule_id), lambda: self._get(schedule_id)
+        )
+        # Shallow copies keep callers from reassigning fields on the cached model.
+        return schedule.model_copy() if schedule is not None else None
+
+    def _get(self, schedule_id: str) -> DeviceSchedule | None:
         with self._session() as session:
             row = session.get(ScheduleModel, schedule_id)
             if row is None:
@@ -871,8 +1222,27 @@ class SqlScheduleRepository(ScheduleRepository):
             memberships = self._schedule_group_map(session, [row.id])
             return _model_to_schedule(row, memberships.get(row.id, []))
 
+    def list_summary(
+        self,
+        *,
+        scope: str | None = None,
+        owner: str | None = None,
+        enabled: bool | None = None,
+    ) -> builtins.list[ScheduleSummaryRecord]:
+        stmt = _list_schedules_stmt(bool(scope), bool(owner), enabled is not None)
+        params = {"scope": scope, "owner": owner, "enabled": enabled}
+        with self._session() as session:
+            rows = session.execute(stmt.options(_SUMMARY_LOAD), params).scalars()
+            return [_to_summary(row) for row in rows]
+
+    def get_summary(self, schedule_id: str) -> ScheduleSummaryRecord | None:
+        with self._session() as session:
+            row = session.get(ScheduleModel, schedule_id, options=[_SUMMARY_LOAD])
+            return _to_summary(row) if row else None
+
     def create(self, payload: ScheduleCreateRequest) -> DeviceSchedule:
         owner = payload.owner_key.lower() if payload.owner_key else None
+        now = _now()
         schedule = DeviceSchedule(
             id=str(uuid.uuid4()),
             scope=payload.scope,
@@ -887,22 +1257,25 @@ class SqlScheduleRepository(ScheduleRepository):
             recurrence=payload.recurrence,
             exceptions=list(payload.exceptions or []),
             enabled=payload.enabled if payload.enabled is not None else True,
-            created_at=_now(),
-            updated_at=_now(),
+            created_at=now,
+            updated_at=now,
         )
         model = _schedule_to_model(schedule)
         with self._session() as session:
-            session.merge(model)
+            session.add(model)
             session.flush()
-            for group_id in schedule.group_ids:
+            for group_id in dict.fromkeys(schedule.group_ids):
                 group_model = session.get(ScheduleGroupModel, group_id)
                 if group_model is None:
                     raise ValueError(f"Schedule group {group_id} not found.")
                 self._add_membership_sql(session, group_model, model)
             self._set_generated_at(session)
-            self._enforce_activation_sql(session)
-            session.commit()
-        return self.get(schedule.id)  # type: ignore[return-value]
+            # Schedules outside any group are never touched by activation rules.
+            if schedule.group_ids:
+                self._enforce_activation_sql(session)
+            self._commit(session)
+            memberships = self._schedule_group_map(session, [schedule.id])
+            return _model_to_schedule(model, memberships.get(schedule.id, []))
 
     def update(
         self, schedule_id: str, payload: ScheduleUpdateRequest
@@ -914,23 +1287,24 @@ class SqlScheduleRepository(ScheduleRepository):
             schedule = _model_to_schedule(existing)
             updated = _apply_update(schedule, payload)
             updated.updated_at = _now()
+            changed = payload.model_fields_set
             existing.scope = updated.scope
             existing.owner_key = updated.owner_key
             existing.label = updated.label
             existing.description = updated.description
-            existing.targets_json = json.dumps(
-                updated.targets.model_dump(mode="json", by_alias=True)
-            )
             existing.action = updated.action
             existing.end_action = updated.end_action
             existing.window_start = updated.window.start.isoformat()
             existing.window_end = updated.window.end.isoformat()
-            existing.recurrence_json = json.dumps(
-                updated.recurrence.model_dump(mode="json", by_alias=True)
-            )
-            existing.exceptions_json = json.dumps(
-                [exception.model_dump(mode="json", by_alias=True) for exception in updated.exceptions]
-            )
+            # Stored documents are still current unless the payload replaced them.
+            if "targets" in changed:
+                existing.targets_json = updated.targets.model_dump_json(by_alias=True)
+            if "recurrence" in changed:
+                existing.recurrence_json = updated.recurrence.model_dump_json(
+                    by_alias=True
+                )
+            if "exceptions" in changed:
+                existing.exceptions_json = _dump_exceptions(updated.exceptions)
             existing.updated_at = updated.updated_at.isoformat()
             if payload.group_ids is not None:
                 desired = set(payload.group_ids)
@@ -943,10 +1317,11 @@ class SqlScheduleRepository(ScheduleRepository):
                         raise ValueError(f"Schedule group {added} not found.")
                     self._add_membership_sql(session, group_model, existing)
                 updated.group_ids = list(desired)
+                self._enforce_activation_sql(session)
             self._set_generated_at(session)
-            self._enforce_activation_sql(session)
-            session.commit()
-        return self.get(schedule_id)
+            self._commit(session)
+            memberships = self._schedule_group_map(session, [schedule_id])
+            return _model_to_schedule(existing, memberships.get(schedule_id, []))
 
     def delete(self, schedule_id: str) -> bool:
         with self._session() as session:
@@ -961,94 +1336,129 @@ class SqlScheduleRepository(ScheduleRepository):
             )
             self._set_generated_at(session)
             self._enforce_activation_sql(session)
-            session.commit()
+            self._commit(session)
             return True
 
     def set_enabled(self, schedule_id: str, enabled: bool) -> DeviceSchedule | None:
+        now_iso = _now().isoformat()
         with self._session() as session:
-            existing = session.get(ScheduleModel, schedule_id)
+            if session.get_bind().dialect.update_returning:
+                # One UPDATE ... RETURNING both flips the flag and loads the row.
+                existing = session.execute(
+                    update(ScheduleModel)
+                    .where(ScheduleModel.id == schedule_id)
+                    .values(enabled=enabled, updated_at=now_iso)
+                    .returning(ScheduleModel),
+                    execution_options={"synchronize_session": False},
+                ).scalar_one_or_none()
+            else:
+                existing = session.get(ScheduleModel, schedule_id)
+                if existing is not None:
+                    existing.enabled = enabled
+                    existing.updated_at = now_iso
             if existing is None:
                 return None
-            existing.enabled = enabled
-            existing.updated_at = _now().isoformat()
             self._set_generated_at(session)
             self._enforce_activation_sql(session)
-            session.commit()
-        return self.get(schedule_id)
+            self._commit(session)
+            memberships = self._schedule_group_map(session, [schedule_id])
+            return _model_to_schedule(existing, memberships.get(schedule_id, []))
 
     def list_for_owner(
         self, owner_key: str
-    ) -> tuple[list[DeviceSchedule], list[DeviceSchedule]]:
+    ) -> tuple[builtins.list[DeviceSchedule], builtins.list[DeviceSchedule]]:
+        owner_schedules, global_schedules = self._cached_read(
+            ("owner", owner_key), lambda: self._list_for_owner(owner_key)
+        )
+        return (
+            [schedule.model_copy() for schedule in owner_schedules],
+            [schedule.model_copy() for schedule in global_schedules],
+        )
+
+    def _list_for_owner(
+        self, owner_key: str
+    ) -> tuple[builtins.list[DeviceSchedule], builtins.list[DeviceSchedule]]:
         with self._session() as session:
-            owner_rows = (
-                session.execute(
-                    select(ScheduleModel).where(
-                        ScheduleModel.scope == "owner",
-                        ScheduleModel.owner_key == owner_key,
-                    )
-                )
-                .scalars()
-                .all()
-            )
-            global_rows = (
+            rows = (
                 session.execute(
-                    select(ScheduleModel).where(ScheduleModel.scope == "global")
+                    _OWNER_AND_GLOBAL_SCHEDULES_STMT, {"owner_key": owner_key}
                 )
                 .scalars()
                 .all()
             )
-            memberships = self._schedule_group_map(
-                session,
-                [row.id for row in owner_rows + global_rows],
-            )
+            owner_rows = [row for row in rows if row.scope == "owner"]
+            global_rows = [row for row in rows if row.scope == "global"]
+            memberships = self._schedule_group_map(session, [row.id for row in rows])
             return (
                 [_model_to_schedule(row, memberships.get(row.id, [])) for row in owner_rows],
                 [_model_to_schedule(row, memberships.get(row.id, [])) for row in global_rows],
             )
 
     def get_metadata(self) -> ScheduleMetadata:
+        metadata = self._cached_read(("metadata", ""), self._load_metadata)
+        return metadata.model_copy()
+
+    def _load_metadata(self) -> ScheduleMetadata:
         with self._session() as session:
             return self._get_metadata(session)
 
     def sync_from_config(self, config: ScheduleConfig, *, replace: bool) -> None:
         with self._session() as session:
             if replace:
-                session.query(ScheduleGroupMembershipModel).delete()
-                session.query(ScheduleGroupModel).delete()
-                session.query(ScheduleModel).delete()
-                for schedule in config.schedules:
-                    model = _schedule_to_model(
-                        DeviceSchedule.model_validate(schedule.model_dump(by_alias=True))
+                for stmt in _CLEAR_SCHEDULE_TABLES_STMTS:
+                    session.execute(
+                        stmt, execution_options={"synchronize_session": False}
                     )
-                    session.merge(model)
+                # Later duplicates win, matching the previous merge-per-row behaviour.
+                rows = {
+                    schedule.id: _schedule_to_row(schedule)
+                    for schedule in config.schedules
+                }
+                if rows:
+                    session.execute(insert(ScheduleModel), list(rows.values()))
             else:
-                existing_ids = {
-                    row.id for row in session.execute(select(ScheduleModel.id)).scalars()
+                insert_missing = _INSERT_MISSING_SCHEDULES_STMTS.get(
+                    session.get_bind().dialect.name
+                )
+                existing_ids: set[str] = set()
+                if insert_missing is None:
+                    existing_ids = set(session.scalars(select(ScheduleModel.id)))
+                    insert_missing = insert(ScheduleModel)
+                rows = {
+                    schedule.id: _schedule_to_row(schedule)
+                    for schedule in config.schedules
+                    if schedule.id not in existing_ids
                 }
-                for schedule in config.schedules:
-                    if schedule.id in existing_ids:
-                        continue
-                    model = _schedule_to_model(
-                        DeviceSchedule.model_validate(schedule.model_dump(by_alias=True))
-                    )
-                    session.merge(model)
-            session.merge(_metadata_to_model(ScheduleMetadata.model_validate(
-                config.metadata.model_dump(by_alias=True)
-            )))
-            session.commit()
+                if rows:
+                    session.execute(insert_missing, list(rows.values()))
+            result = cast(
+                CursorResult[Any],
+                session.execute(
+                    update(ScheduleMetadataModel)
+                    .where(ScheduleMetadataModel.id == 1)
+                    .values(
+                        timezone=config.metadata.timezone,
+                        generated_at=config.metadata.generated_at.isoformat(),
+                    ),
+                    execution_options={"synchronize_session": False},
+                ),
+            )
+            if result.rowcount == 0:
+                session.add(_metadata_to_model(config.metadata))
+            self._commit(session)
 
     def clone(self, schedule_id: str, target_owner: str) -> DeviceSchedule | None:
         with self._session() as session:
             source = session.get(ScheduleModel, schedule_id)
             if source is None:
                 return None
-            schedule = _model_to_schedule(source)
-            clone = _clone_for_owner(schedule, target_owner.lower())
-            model = _schedule_to_model(clone)
-            session.merge(model)
+            clone = ScheduleModel(
+                **_clone_row_for_owner(source, target_owner, _now().isoformat())
+            )
+            session.add(clone)
             self._set_generated_at(session)
-            session.commit()
-        return self.get(clone.id)
+            self._commit(session)
+            return _model_to_schedule(clone)
 
     def copy_owner_schedules(
         self,
@@ -1056,108 +1466,84 @@ class SqlScheduleRepository(ScheduleRepository):
         target_owner: str,
         *,
         mode: Literal["merge", "replace"],
-    ) -> tuple[list[DeviceSchedule], int]:
+    ) -> tuple[builtins.list[DeviceSchedule], int]:
         source_owner = source_owner.lower()
         target_owner = target_owner.lower()
-        created: list[DeviceSchedule] = []
         replaced_count = 0
         with self._session() as session:
             source_rows = (
-                session.execute(
-                    select(ScheduleModel).where(
-                        ScheduleModel.scope == "owner",
-                        ScheduleModel.owner_key == source_owner,
-                    )
-                )
+                session.execute(_OWNER_SCHEDULES_STMT, {"owner_key": source_owner})
                 .scalars()
                 .all()
             )
             if not source_rows:
                 return [], 0
             if mode == "replace":
-                target_rows = (
-                    session.execute(
-                        select(ScheduleModel).where(
-                            ScheduleModel.scope == "owner",
-                            ScheduleModel.owner_key == target_owner,
-                        )
-                    )
-                    .scalars()
-                    .all()
+                params = {"owner_key": target_owner}
+                session.execute(
+                    _DELETE_OWNER_MEMBERSHIPS_STMT,
+                    params,
+                    execution_options={"synchronize_session": False},
                 )
-                replaced_count = len(target_rows)
-                for row in target_rows:
+                deleted = cast(
+                    CursorResult[Any],
                     session.execute(
-                        delete(ScheduleGroupMembershipModel).where(
-                            ScheduleGroupMembershipModel.schedule_id == row.id
-                        )
-                    )
-                    session.delete(row)
-            for row in source_rows:
-                schedule = _model_to_schedule(row)
-                clone = _clone_for_owner(schedule, target_owner)
-                model = _schedule_to_model(clone)
-                session.merge(model)
-                created.append(clone)
+                        _DELETE_OWNER_SCHEDULES_STMT,
+                        params,
+                        execution_options={"synchronize_session": False},
+                    ),
+                )
+                replaced_count = deleted.rowcount
+            now_iso = _now().isoformat()
+            rows = [
+                _clone_row_for_owner(row, target_owner, now_iso) for row in source_rows
+            ]
+            session.execute(insert(ScheduleModel), rows)
             self._set_generated_at(session)
-            session.commit()
-        return [self.get(item.id) for item in created if item.id], replaced_count  # type: ignore[list-item]
+            self._commit(session)
+        created = [_model_to_schedule(ScheduleModel(**row)) for row in rows]
+        return created, replaced_count
 
     # Group management ------------------------------------------------
 
     def list_groups(
         self, owner_key: str | None = None
-    ) -> list[tuple[ScheduleGroupRecord, list[DeviceSchedule]]]:
+    ) -> builtins.list[tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]]]:
         with self._session() as session:
-            stmt = select(ScheduleGroupModel)
             if owner_key is None:
-                stmt = stmt.where(ScheduleGroupModel.owner_key.is_(None))
+                result = session.execute(_GLOBAL_GROUPS_STMT)
             else:
-                stmt = stmt.where(ScheduleGroupModel.owner_key == owner_key)
-            groups = session.execute(stmt).scalars().all()
-            result: list[tuple[ScheduleGroupRecord, list[DeviceSchedule]]] = []
-            for group in groups:
-                records = self._group_schedule_ids(session, group.id)
-                schedule_rows = (
-                    session.execute(
-                        select(ScheduleModel).where(ScheduleModel.id.in_(records))
-                    )
-                    .scalars()
-                    .all()
+                result = session.execute(
+                    _GROUPS_BY_OWNER_STMT, {"owner_key": owner_key}
                 )
-                memberships = self._schedule_group_map(session, records)
-                result.append(
-                    (
-                        self._model_to_group_record(group),
-                        [
-                            _model_to_schedule(row, memberships.get(row.id, []))
-                            for row in schedule_rows
-                        ],
-                    )
+            groups = result.scalars().all()
+            memberships = self._schedule_group_map(
+                session,
+                {row.id for group in groups for row in group.schedules},
+            )
+            return [
+                (
+                    self._model_to_group_record(group),
+                    [
+                        _model_to_schedule(row, memberships.get(row.id, []))
+                        for row in group.schedules
+                    ],
                 )
-            return result
+                for group in groups
+            ]
 
-    def get_group(self, group_id: str) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]] | None:
+    def get_group(
+        self, group_id: str
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]] | None:
         with self._session() as session:
-            group = session.get(ScheduleGroupModel, group_id)
+            group = session.get(
+                ScheduleGroupModel,
+                group_id,
+                options=[selectinload(ScheduleGroupModel.schedules)],
+            )
             if group is None:
                 return None
-            records = self._group_schedule_ids(session, group.id)
-            schedule_rows = (
-                session.execute(
-                    select(ScheduleModel).where(ScheduleModel.id.in_(records))
-                )
-                .scalars()
-                .all()
-            )
-            memberships = self._schedule_group_map(session, records)
-            return (
-                self._model_to_group_record(group),
-                [
-                    _model_to_schedule(row, memberships.get(row.id, []))
-                    for row in schedule_rows
-                ],
-            )
+            return self._group_result(session, group, group.schedules)
 
     def create_group(
         self,
@@ -1165,9 +1551,9 @@ class SqlScheduleRepository(ScheduleRepository):
         *,
         owner_key: str | None,
         description: str | None,
-        schedule_ids: list[str],
+        schedule_ids: builtins.list[str],
         is_active: bool,
-    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]]:
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]]:
         now_iso = _now().isoformat()
         owner = owner_key.lower() if owner_key else None
         group_model = ScheduleGroupModel(
@@ -1181,20 +1567,23 @@ class SqlScheduleRepository(ScheduleRepository):
             updated_at=now_iso,
         )
         with self._session() as session:
-            session.merge(group_model)
+            session.add(group_model)
             session.flush()
+            schedule_models = self._schedules_by_id(session, schedule_ids)
             for schedule_id in schedule_ids:
-                schedule_model = session.get(ScheduleModel, schedule_id)
-                if schedule_model is None:
+                if schedule_id not in schedule_models:
                     raise ValueError(f"Schedule {schedule_id} not found.")
-                self._add_membership_sql(session, group_model, schedule_model)
+            for schedule_id in dict.fromkeys(schedule_ids):
+                self._add_membership_sql(
+                    session, group_model, schedule_models[schedule_id]
+                )
             if is_active and schedule_ids:
                 self._activate_group_sql(session, group_model)
-            else:
+            elif schedule_ids:
                 self._enforce_activation_sql(session)
             self._set_generated_at(session)
-            session.commit()
-        return self.get_group(group_model.id)  # type: ignore[return-value]
+            self._commit(session)
+            return self._group_result(session, group_model)
 
     def update_group(
         self,
@@ -1202,9 +1591,9 @@ class SqlScheduleRepository(ScheduleRepository):
         *,
         name: str | None = None,
         description: str | None = None,
-        schedule_ids: list[str] | None = None,
+        schedule_ids: builtins.list[str] | None = None,
         is_active: bool | None = None,
-    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]] | None:
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]] | None:
         with self._session() as session:
             group_model = session.get(ScheduleGroupModel, group_id)
             if group_model is None:
@@ -1216,26 +1605,30 @@ class SqlScheduleRepository(ScheduleRepository):
             if schedule_ids is not None:
                 desired = set(schedule_ids)
                 current = set(self._group_schedule_ids(session, group_id))
+                # Load every affected schedule up front so the membership helpers
+                # resolve rows from the identity map instead of one query each.
+                schedule_models = self._schedules_by_id(session, current | desired)
+                for added in desired - current:
+                    if added not in schedule_models:
+                        raise ValueError(f"Schedule {added} not found.")
                 for removed in current - desired:
                     self._remove_membership_sql(session, group_id, removed)
                 for added in desired - current:
-                    schedule_model = session.get(ScheduleModel, added)
-                    if schedule_model is None:
-                        raise ValueError(f"Schedule {added} not found.")
-                    self._add_membership_sql(session, group_model, schedule_model)
-            if is_active is not None:
-                if is_active:
-                    self._activate_group_sql(session, group_model)
-                else:
-                    if group_model.is_active:
-                        group_model.is_active = False
-                        group_model.updated_at = _now().isoformat()
-                        self._enforce_activation_sql(session)
+                    self._add_membership_sql(
+                        session, group_model, schedule_models[added]
+                    )
+            if is_active:
+                self._activate_group_sql(session, group_model)
             else:
-                self._enforce_activation_sql(session)
+                deactivated = is_active is False and group_model.is_active
+                if deactivated:
+                    group_model.is_active = False
+                    group_model.updated_at = _now().isoformat()
+                if deactivated or schedule_ids is not None:
+                    self._enforce_activation_sql(session)
             self._set_generated_at(session)
-            session.commit()
-        return self.get_group(group_id)
+            self._commit(session)
+            return self._group_result(session, group_model)
 
     def delete_group(self, group_id: str) -> bool:
         with self._session() as session:
@@ -1250,14 +1643,14 @@ class SqlScheduleRepository(ScheduleRepository):
             session.delete(group_model)
             self._set_generated_at(session)
             self._enforce_activation_sql(session)
-            session.commit()
+            self._commit(session)
             return True
 
     def set_group_active(
         self,
         group_id: str,
         active: bool,
-    ) -> tuple[ScheduleGroupRecord, list[DeviceSchedule]] | None:
+    ) -> tuple[ScheduleGroupRecord, builtins.list[DeviceSchedule]] | None:
         with self._session() as session:
             group_model = session.get(ScheduleGroupModel, group_id)
             if group_model is None:
@@ -1270,8 +1663,8 @@ class SqlScheduleRepository(ScheduleRepository):
                     group_model.updated_at = _now().isoformat()
                     self._enforce_activation_sql(session)
             self._set_generated_at(session)
-            session.commit()
-        return self.get_group(group_id)
+            self._commit(session)
+            return self._group_result(session, group_model)
 
 
 # ---------------------------------------------------------------------------
@@ -1279,18 +1672,39 @@ class SqlScheduleRepository(ScheduleRepository):
 # ---------------------------------------------------------------------------
 
 
-@lru_cache
+_default_repository: InMemoryScheduleRepository | None = None
+_sql_repository: SqlScheduleRepository | None = None
+
+
 def _default_schedule_repository() -> InMemoryScheduleRepository:
-    return InMemoryScheduleRepository()
+    global _default_repository
+    if _default_repository is None:
+        _default_repository = InMemoryScheduleRepository()
+    return _default_repository
 
 
-@lru_cache
 def _sql_schedule_repository() -> SqlScheduleRepository:
-    return SqlScheduleRepository()
+    global _sql_repository
+    if _sql_repository is None:
+        _sql_repository = SqlScheduleRepository()
+    return _sql_repository
+
+
+_resolved_repository: ScheduleRepository | None = None
 
 
 def get_schedule_repository() -> ScheduleRepository:
     """Return the configured schedule repository."""
-    if is_database_configured() and get_engine() is not None:
-        return _sql_schedule_repository()
-    return _default_schedule_repository()
+    global _resolved_repository
+    if _resolved_repository is None:
+        if is_database_configured() and get_engine() is not None:
+            _resolved_repository = _sql_schedule_repository()
+        else:
+            _resolved_repository = _default_schedule_repository()
+    return _resolved_repository
+
+
+def reset_schedule_repository() -> None:
+    """Forget the resolved repository so the next lookup re-reads configuration."""
+    global _resolved_repository
+    _resolved_repository = None
@@ -3,9 +3,20 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any, Literal
+from functools import cache
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+
+def _normalize_token(value: Any) -> Any:
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+# MACs, owner keys and device types are compared case-insensitively everywhere
+# downstream, so requests canonicalise them once here.
+MacAddress = Annotated[str, BeforeValidator(_normalize_token), Field(min_length=1)]
+NormalizedKey = Annotated[str | None, BeforeValidator(_normalize_token)]
 
 
 class DeviceStatus(BaseModel):
@@ -65,8 +76,8 @@ class DeviceDPIEntry(BaseModel):
 
 class DeviceRegistrationRequest(BaseModel):
     name: str | None = None
-    type: str | None = None
-    mac: str = Field(..., min_length=1)
+    type: NormalizedKey = None
+    mac: MacAddress
     actor: str | None = None
     reason: str | None = None
 
@@ -101,10 +112,10 @@ class VerifyPinResponse(BaseModel):
 
 
 class DeviceTarget(BaseModel):
-    mac: str = Field(..., min_length=1)
+    mac: MacAddress
     name: str | None = None
-    owner: str | None = None
-    type: str | None = None
+    owner: NormalizedKey = None
+    type: NormalizedKey = None
 
 
 class DeviceActionRequest(BaseModel):
@@ -151,10 +162,10 @@ class UnregisteredClientsResponse(BaseModel):
 
 
 class SingleClientLockRequest(BaseModel):
-    mac: str
+    mac: MacAddress
     name: str | None = None
-    owner: str | None = None
-    type: str | None = None
+    owner: NormalizedKey = None
+    type: NormalizedKey = None
     unlock: bool = False
     actor: str | None = None
     reason: str | None = None
@@ -164,12 +175,19 @@ class SingleClientLockRequest(BaseModel):
 # Schedule models
 
 
+# Every CamelModel shares this generator and field names repeat across models
+# (owner_key, end_action, created_at, ...), so each name is converted only once.
+@cache
 def _to_camel(string: str) -> str:
+    if "_" not in string:
+        return string
     first, *rest = string.split("_")
     return first + "".join(word.capitalize() for word in rest)
 
 
 class CamelModel(BaseModel):
+    # Request models used by a single endpoint set ``defer_build=True`` so their
+    # validators are built on first use instead of at import.
     model_config = ConfigDict(alias_generator=_to_camel, populate_by_name=True)
 
 
@@ -287,6 +305,8 @@ class ScheduleCreateRequest(CamelModel):
 
 
 class ScheduleUpdateRequest(CamelModel):
+    model_config = ConfigDict(defer_build=True)
+
     scope: Literal["owner", "global"] | None = None
     owner_key: str | None = Field(default=None, alias="ownerKey")
     group_ids: list[str] | None = Field(default=None, alias="groupIds")
@@ -313,6 +333,8 @@ class OwnerScheduleResponse(CamelModel):
 
 
 class ScheduleCloneRequest(CamelModel):
+    model_config = ConfigDict(defer_build=True)
+
     target_owner: str = Field(alias="targetOwner", min_length=1)
 
 
@@ -321,6 +343,8 @@ class ScheduleCloneResponse(CamelModel):
 
 
 class OwnerScheduleCopyRequest(CamelModel):
+    model_config = ConfigDict(defer_build=True)
+
     target_owner: str = Field(alias="targetOwner", min_length=1)
     mode: Literal["merge", "replace"] = "merge"
 
@@ -345,6 +369,8 @@ class ScheduleGroup(CamelModel):
 
 
 class ScheduleGroupCreateRequest(CamelModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     description: str | None = None
     owner_key: str | None = Field(default=None, alias="ownerKey")
@@ -353,6 +379,8 @@ class ScheduleGroupCreateRequest(CamelModel):
 
 
 class ScheduleGroupUpdateRequest(CamelModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str | None = None
     description: str | None = None
     schedule_ids: list[str] | None = Field(default=None, alias="scheduleIds")
@@ -365,6 +393,8 @@ class ScheduleGroupListResponse(CamelModel):
 
 
 class ScheduleGroupActivateRequest(CamelModel):
+    model_config = ConfigDict(defer_build=True)
+
     active: bool | None = Field(default=None, alias="active")
     schedule_id: str | None = Field(default=None, alias="scheduleId")
 
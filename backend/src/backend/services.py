@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
+import atexit
+from collections import defaultdict
 from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import UTC, datetime, timedelta
+from threading import Lock
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 from .owners import get_owner_repository
 from .ubiquiti.config import settings
 from .ubiquiti.devices import Device, get_device_repository
 from .ubiquiti.firewall import FirewallManager
-from .ubiquiti.lock import DeviceLocker
+from .ubiquiti.lock import DeviceLocker, build_lock_index
 from .ubiquiti.network import NetworkDeviceService
 from .ubiquiti.unifi import UniFiAPIError, UniFiClient
 from .ubiquiti.utils import (
     logger,
     lookup_mac_vendor,
+    normalize_mac,
     suppress_insecure_request_warning,
 )
 from .events import record_event
@@ -24,8 +31,21 @@ from .events import record_event
 if TYPE_CHECKING:
     from .schemas import DeviceTarget
 
+# Upper bound on concurrent controller calls issued by apply_lock_action.
+_LOCK_ACTION_MAX_WORKERS = 8
 
-class DeviceRecord(TypedDict):
+# Exact types the numeric coercion helpers convert without further checks.
+_NUMERIC_TYPES = frozenset((int, float, bool))
+
+# Largest number of traffic samples returned in a device detail summary.
+_TRAFFIC_SAMPLE_LIMIT = 120
+
+# Sort key stand-in for clients the controller reports without a last-seen time.
+_EPOCH = datetime.fromtimestamp(0, tz=UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceRecord:
     name: str
     owner: str
     type: str
@@ -34,7 +54,8 @@ class DeviceRecord(TypedDict):
     vendor: str | None
 
 
-class ClientRecord(TypedDict):
+@dataclass(frozen=True, slots=True)
+class ClientRecord:
     name: str
     mac: str
     ip: str | None
@@ -43,14 +64,16 @@ class ClientRecord(TypedDict):
     locked: bool
 
 
-class ActionResult(TypedDict):
+@dataclass(frozen=True, slots=True)
+class ActionResult:
     mac: str
     locked: bool
     status: Literal["success", "skipped", "error"]
     message: str | None
 
 
-class OwnerSummaryRecord(TypedDict):
+@dataclass(frozen=True, slots=True)
+class OwnerSummaryRecord:
     key: str
     display_name: str
     total_devices: int
@@ -98,37 +121,59 @@ class DeviceDPIRecord(TypedDict):
     category: str | None
     rx_bytes: int
     tx_bytes: int
-    dpi_applications: list["DeviceDPIRecord"]
 
 
-class DeviceDPIRecord(TypedDict):
-    application: str
-    category: str | None
-    rx_bytes: int
-    tx_bytes: int
+_shared_firewall: FirewallManager | None = None
+_shared_firewall_lock = Lock()
+
+
+def _close_shared_firewall() -> None:
+    global _shared_firewall
+    with _shared_firewall_lock:
+        if _shared_firewall is not None:
+            _shared_firewall.client.close()
+            _shared_firewall = None
+
+
+def _get_shared_firewall() -> FirewallManager:
+    global _shared_firewall
+    with _shared_firewall_lock:
+        if _shared_firewall is None:
+            client = UniFiClient(
+                settings.unifi_base_url,
+                api_key=settings.unifi_api_key,
+                verify_ssl=settings.verify_ssl,
+                pool_maxsize=_LOCK_ACTION_MAX_WORKERS,
+            )
+            suppress_insecure_request_warning(client.verify_ssl)
+            # Open the session here so concurrent requests never race to create it.
+            client.establish_connection()
+            _shared_firewall = FirewallManager(client)
+        return _shared_firewall
+
+
+atexit.register(_close_shared_firewall)
 
 
 @contextmanager
 def locker_context() -> Iterator[tuple[FirewallManager, DeviceLocker]]:
-    """Yield a configured FirewallManager and DeviceLocker pair."""
-    client = UniFiClient(
-        settings.unifi_base_url,
-        api_key=settings.unifi_api_key,
-        verify_ssl=settings.verify_ssl,
-    )
-    suppress_insecure_request_warning(client.verify_ssl)
-    firewall = FirewallManager(client)
-    locker = DeviceLocker(firewall)
-    try:
-        yield firewall, locker
-    finally:
-        client.close()
+    """Yield a FirewallManager and DeviceLocker pair backed by a shared client.
+
+    The UniFiClient and its HTTP session (with pooled keep-alive connections)
+    live for the whole process and are closed at interpreter exit. The locker is
+    cheap to build once the firewall has cached the WAN group id, and building
+    it per call keeps retrying that lookup until it succeeds.
+    """
+    firewall = _get_shared_firewall()
+    yield firewall, DeviceLocker(firewall)
 
 
 def _timestamp_to_datetime(value: object) -> datetime | None:
-    if value is None:
+    if type(value) in _NUMERIC_TYPES:
+        ts = float(value)  # type: ignore[arg-type]
+    elif value is None:
         return None
-    if isinstance(value, (int, float)):
+    elif isinstance(value, (int, float)):
         ts = float(value)
     elif isinstance(value, str):
         try:
@@ -139,15 +184,24 @@ def _timestamp_to_datetime(value: object) -> datetime | None:
         return None
     if ts > 10**11:  # values returned in milliseconds
         ts /= 1000.0
+    return _ts_to_dt(ts)
+
+
+@lru_cache(maxsize=1024)
+def _ts_to_dt(ts: float) -> datetime | None:
+    # Clients and samples often share a timestamp; the local-timezone lookup in
+    # astimezone() is the expensive part, so conversions are memoised.
     try:
         return datetime.fromtimestamp(ts, tz=UTC).astimezone()
-    except (OverflowError, OSError):
+    except (OverflowError, OSError, ValueError):
         return None
 
 
 def _safe_int(value: object) -> int:
-    if isinstance(value, bool):
-        return int(value)
+    # Controller payloads are almost always plain numbers; dispatch on the exact
+    # type first and only fall back to the isinstance chain for anything else.
+    if type(value) in _NUMERIC_TYPES:
+        return int(value)  # type: ignore[call-overload]
     if isinstance(value, (int, float)):
         return int(value)
     if isinstance(value, str):
@@ -159,6 +213,8 @@ def _safe_int(value: object) -> int:
 
 
 def _safe_float(value: object) -> float | None:
+    if type(value) in _NUMERIC_TYPES:
+        return float(value)  # type: ignore[arg-type]
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
@@ -200,8 +256,8 @@ def _build_traffic_summary(
     samples: list[DeviceTrafficSample] = []
     total_rx = 0
     total_tx = 0
-    start_dt: datetime | None = None
-    end_dt: datetime | None = None
+    previous: datetime | None = None
+    in_order = True
 
     for entry in entries:
         timestamp = _timestamp_to_datetime(entry.get("time"))
@@ -211,8 +267,9 @@ def _build_traffic_summary(
         tx_value = max(_safe_int(entry.get("tx_bytes")), 0)
         total_rx += rx_value
         total_tx += tx_value
-        start_dt = timestamp if start_dt is None or timestamp < start_dt else start_dt
-        end_dt = timestamp if end_dt is None or timestamp > end_dt else end_dt
+        if previous is not None and timestamp < previous:
+            in_order = False
+        previous = timestamp
         samples.append(
             {
                 "timestamp": timestamp,
@@ -225,29 +282,77 @@ def _build_traffic_summary(
     if not samples:
         return None
 
-    samples.sort(key=lambda item: item["timestamp"])
+    # The controller normally reports samples oldest-first; only sort when it didn't.
+    if not in_order:
+        samples.sort(key=lambda item: item["timestamp"])
     return {
         "interval_minutes": lookback_minutes,
-        "start": start_dt,
-        "end": end_dt,
+        "start": samples[0]["timestamp"],
+        "end": samples[-1]["timestamp"],
         "total_rx_bytes": total_rx,
         "total_tx_bytes": total_tx,
-        "samples": samples,
+        "samples": _downsample_lttb(samples, _TRAFFIC_SAMPLE_LIMIT),
     }
 
 
+def _downsample_lttb(
+    samples: list[DeviceTrafficSample], threshold: int
+) -> list[DeviceTrafficSample]:
+    """Reduce time-ordered samples to ``threshold`` points, keeping peaks visible.
+
+    Largest-Triangle-Three-Buckets keeps the first and last samples and, from each
+    bucket in between, the sample forming the largest triangle with the previously
+    kept point and the average of the next bucket.
+    """
+    count = len(samples)
+    if threshold < 3 or count <= threshold:
+        return samples
+
+    xs = [sample["timestamp"].timestamp() for sample in samples]
+    ys = [sample["total_bytes"] for sample in samples]
+    bucket_size = (count - 2) / (threshold - 2)
+
+    kept = [samples[0]]
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        # Buckets hold at least one sample because count > threshold.
+        span = next_end - end
+        avg_x = sum(xs[end:next_end]) / span
+        avg_y = sum(ys[end:next_end]) / span
+
+        ax = xs[anchor]
+        ay = ys[anchor]
+        best = start
+        best_area = -1.0
+        for index in range(start, end):
+            area = abs(
+                (ax - avg_x) * (ys[index] - ay) - (ax - xs[index]) * (avg_y - ay)
+            )
+            if area > best_area:
+                best_area = area
+                best = index
+        kept.append(samples[best])
+        anchor = best
+
+    kept.append(samples[-1])
+    return kept
+
+
 def _extract_dpi_entries(
     entries: Iterable[Mapping[str, Any]],
     target_mac: str,
 ) -> list[DeviceDPIRecord]:
-    normalized_mac = target_mac.lower()
+    normalized_mac = normalize_mac(target_mac)
     results: list[DeviceDPIRecord] = []
     for entry in entries:
         entry_mac = None
         for key in ("client_mac", "mac", "user_mac"):
             value = entry.get(key)
             if isinstance(value, str) and value.strip():
-                entry_mac = value.strip().lower()
+                entry_mac = normalize_mac(value)
                 break
         if entry_mac and entry_mac != normalized_mac:
             continue
@@ -282,26 +387,31 @@ def _extract_dpi_entries(
     return results
 
 
+def iter_registered_device_records() -> Iterator[DeviceRecord]:
+    """Yield the current status of every registered device.
+
+    Firewall rules are fetched before this returns, so controller errors surface
+    to the caller immediately; the per-device records are produced lazily.
+    """
+    device_repo = get_device_repository()
+    with locker_context() as (firewall, _locker):
+        lock_index = build_lock_index(firewall.list_rules())
+    return (
+        DeviceRecord(
+            name=device.name,
+            owner=device.owner,
+            type=device.type,
+            mac=device.mac,
+            locked=lock_index.is_locked(device),
+            vendor=lookup_mac_vendor(device.mac),
+        )
+        for device in device_repo.list_all()
+    )
+
+
 def get_registered_device_records() -> list[DeviceRecord]:
     """Return the current status of every registered device."""
-    device_repo = get_device_repository()
-    with locker_context() as (firewall, locker):
-        rules = firewall.list_rules()
-        records: list[DeviceRecord] = []
-        for device in device_repo.list_all():
-            locked = locker.is_device_locked(device, rules)
-            vendor = lookup_mac_vendor(device.mac)
-            records.append(
-                {
-                    "name": device.name,
-                    "owner": device.owner,
-                    "type": device.type,
-                    "mac": device.mac,
-                    "locked": locked,
-                    "vendor": vendor,
-                }
-            )
-        return records
+    return list(iter_registered_device_records())
 
 
 def register_device_for_owner(
@@ -312,10 +422,10 @@ def register_device_for_owner(
     device_type: str | None = None,
 ) -> DeviceRecord:
     """Register or update a device under the specified owner."""
+    mac_normalized = normalize_mac(mac)
     device_repo = get_device_repository()
-    existing = device_repo.get_by_mac(mac)
+    existing = device_repo.get_by_mac(mac_normalized)
 
-    mac_normalized = mac.strip().lower()
     owner_normalized = owner_key.strip().lower()
 
     name_value = (name or (existing.name if existing else None) or mac_normalized).strip()
@@ -340,57 +450,84 @@ def register_device_for_owner(
         locked = locker.is_device_locked(saved, rules)
 
     vendor = lookup_mac_vendor(saved.mac)
-    return {
-        "name": saved.name,
-        "owner": saved.owner,
-        "type": saved.type,
-        "mac": saved.mac,
-        "locked": locked,
-        "vendor": vendor,
-    }
+    return DeviceRecord(
+        name=saved.name,
+        owner=saved.owner,
+        type=saved.type,
+        mac=saved.mac,
+        locked=locked,
+        vendor=vendor,
+    )
 
 
 def summarize_owner_records(records: list[DeviceRecord]) -> list[OwnerSummaryRecord]:
     """Aggregate device counts by owner."""
     owner_repo = get_owner_repository()
-    grouped: dict[str, list[DeviceRecord]] = {}
+    # owner key -> [total, locked], filled in a single pass over the records.
+    counts: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0])
     for record in records:
-        grouped.setdefault(record["owner"], []).append(record)
+        tally = counts[record.owner]
+        tally[0] += 1
+        if record.locked:
+            tally[1] += 1
 
+    owners = owner_repo.get_many(counts)
     summaries: list[OwnerSummaryRecord] = []
-    for owner_key in sorted(grouped):
-        rows = grouped[owner_key]
-        locked_count = sum(1 for row in rows if row["locked"])
-        owner_entry = owner_repo.get(owner_key)
+    for owner_key in sorted(counts):
+        total_count, locked_count = counts[owner_key]
+        owner_entry = owners.get(owner_key.lower())
         display_name = (
             owner_entry.display_name if owner_entry is not None else owner_key.title()
         )
         summaries.append(
-            {
-                "key": owner_key,
-                "display_name": display_name,
-                "total_devices": len(rows),
-                "locked_devices": locked_count,
-                "unlocked_devices": len(rows) - locked_count,
-            }
+            OwnerSummaryRecord(
+                key=owner_key,
+                display_name=display_name,
+                total_devices=total_count,
+                locked_devices=locked_count,
+                unlocked_devices=total_count - locked_count,
+            )
         )
     return summaries
 
 
 def build_device_from_target(target: DeviceTarget) -> Device:
     """Return a Device dataclass instance for locking operations."""
-    mac = target.mac.strip()
+    # DeviceTarget has already stripped and lowercased mac, owner and type.
+    mac = target.mac
     device_repo = get_device_repository()
     registered = device_repo.get_by_mac(mac)
     if registered is not None:
         return registered
 
     name = target.name.strip() if target.name else mac
-    owner = (target.owner or "unregistered").strip().lower()
-    device_type = (target.type or "unknown").strip().lower()
+    owner = target.owner or "unregistered"
+    device_type = target.type or "unknown"
     return Device(name=name, mac=mac, owner=owner, type=device_type)
 
 
+def _record_lock_result(
+    action: str,
+    result: ActionResult,
+    *,
+    unlock: bool,
+    actor: str | None,
+    reason: str | None,
+) -> None:
+    record_event(
+        action=action,
+        subject_type="device",
+        subject_id=result.mac,
+        actor=actor,
+        reason=reason,
+        metadata={
+            "status": result.status,
+            "message": result.message,
+            "unlock": unlock,
+        },
+    )
+
+
 def apply_lock_action(
     devices: Iterable[Device],
     *,
@@ -398,221 +535,163 @@ def apply_lock_action(
     actor: str | None = None,
     reason: str | None = None,
 ) -> list[ActionResult]:
-    """Lock or unlock the provided devices and return per-device results."""
-    results: list[ActionResult] = []
+    """Lock or unlock the provided devices and return per-device results.
+
+    Controller mutations run on a bounded thread pool; results and audit events
+    keep the order of ``devices``.
+    """
+    devices = list(devices)
+    if not devices:
+        return []
+
+    outcomes: dict[int, tuple[str, ActionResult]] = {}
+    pending: list[tuple[int, Device, int | None]] = []
     with locker_context() as (firewall, locker):
-        rules = firewall.list_rules()
-        for device in devices:
-            try:
-                locked_before = locker.is_device_locked(device, rules)
-            except UniFiAPIError as exc:
-                result = {
-                    "mac": device.mac,
-                    "locked": False,
-                    "status": "error",
-                    "message": str(exc),
-                }
-                results.append(result)
-                record_event(
-                    action="device_status_failed",
-                    subject_type="device",
-                    subject_id=device.mac,
-                    actor=actor,
-                    reason=reason,
-                    metadata={
-                        "status": result["status"],
-                        "message": result["message"],
-                        "unlock": unlock,
-                    },
+        # Served from the firewall's short-lived snapshot when one is fresh, so a
+        # batch where every device is already in the requested state makes no
+        # controller calls at all.
+        rules = list(firewall.list_rules())
+        lock_index = build_lock_index(rules)
+        next_index = 0 if unlock else locker.next_rule_index(rules)
+        for position, device in enumerate(devices):
+            locked_before = lock_index.is_locked(device)
+            if unlock and not locked_before:
+                outcomes[position] = (
+                    "device_unlock_skipped",
+                    ActionResult(
+                        mac=device.mac,
+                        locked=False,
+                        status="skipped",
+                        message="Device already unlocked.",
+                    ),
                 )
                 continue
-
-            if unlock:
-                if not locked_before:
-                    result = {
-                        "mac": device.mac,
-                        "locked": False,
-                        "status": "skipped",
-                        "message": "Device already unlocked.",
-                    }
-                    results.append(result)
-                    record_event(
-                        action="device_unlock_skipped",
-                        subject_type="device",
-                        subject_id=device.mac,
-                        actor=actor,
-                        reason=reason,
-                        metadata={
-                            "status": result["status"],
-                            "message": result["message"],
-                            "unlock": unlock,
-                        },
-                    )
-                    continue
-                try:
-                    locker.unlock_device(device)
-                except UniFiAPIError as exc:
-                    result = {
-                        "mac": device.mac,
-                        "locked": locked_before,
-                        "status": "error",
-                        "message": str(exc),
-                    }
-                    results.append(result)
-                    record_event(
-                        action="device_unlock_failed",
-                        subject_type="device",
-                        subject_id=device.mac,
-                        actor=actor,
-                        reason=reason,
-                        metadata={
-                            "status": result["status"],
-                            "message": result["message"],
-                            "unlock": unlock,
-                        },
-                    )
-                    continue
-                rules = firewall.list_rules()
-                locked_after = locker.is_device_locked(device, rules)
-                result = {
-                    "mac": device.mac,
-                    "locked": locked_after,
-                    "status": "success",
-                    "message": "Unlocked device.",
-                }
-                results.append(result)
-                record_event(
-                    action="device_unlocked",
-                    subject_type="device",
-                    subject_id=device.mac,
-                    actor=actor,
-                    reason=reason,
-                    metadata={
-                        "status": result["status"],
-                        "message": result["message"],
-                        "unlock": unlock,
-                    },
+            if not unlock and locked_before:
+                outcomes[position] = (
+                    "device_lock_skipped",
+                    ActionResult(
+                        mac=device.mac,
+                        locked=True,
+                        status="skipped",
+                        message="Device already locked.",
+                    ),
                 )
-            else:
-                if locked_before:
-                    result = {
-                        "mac": device.mac,
-                        "locked": True,
-                        "status": "skipped",
-                        "message": "Device already locked.",
-                    }
-                    results.append(result)
-                    record_event(
-                        action="device_lock_skipped",
-                        subject_type="device",
-                        subject_id=device.mac,
-                        actor=actor,
-                        reason=reason,
-                        metadata={
-                            "status": result["status"],
-                            "message": result["message"],
-                            "unlock": unlock,
-                        },
-                    )
-                    continue
+                continue
+            rule_index = None
+            if not unlock:
+                # Reserve indexes up front so concurrent locks never collide. A
+                # failed lock leaves its index unused; UniFi only needs indexes to
+                # be unique and ordered, and the next batch starts above the
+                # highest one in use, so the gap is never reused out of order.
+                rule_index = next_index
+                next_index += 1
+            pending.append((position, device, rule_index))
+
+        def mutate(device: Device, rule_index: int | None) -> bool:
+            # Each worker edits its own copy of the snapshot and reports the
+            # device's lock state from it.
+            if unlock:
+                remaining = list(rules)
+                locker.unlock_device(device, rules=remaining)
+                return build_lock_index(remaining).is_locked(device)
+            created: list[Mapping[str, object]] = []
+            locker.lock_device(device, rules=created, rule_index=rule_index)
+            return build_lock_index(created).is_locked(device)
+
+        if pending:
+            workers = min(_LOCK_ACTION_MAX_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(mutate, device, rule_index)
+                    for _, device, rule_index in pending
+                ]
+            for (position, device, _), future in zip(pending, futures, strict=True):
                 try:
-                    locker.lock_device(device)
+                    locked_after = future.result()
                 except UniFiAPIError as exc:
-                    result = {
-                        "mac": device.mac,
-                        "locked": locked_before,
-                        "status": "error",
-                        "message": str(exc),
-                    }
-                    results.append(result)
-                    record_event(
-                        action="device_lock_failed",
-                        subject_type="device",
-                        subject_id=device.mac,
-                        actor=actor,
-                        reason=reason,
-                        metadata={
-                            "status": result["status"],
-                            "message": result["message"],
-                            "unlock": unlock,
-                        },
+                    outcomes[position] = (
+                        "device_unlock_failed" if unlock else "device_lock_failed",
+                        ActionResult(
+                            mac=device.mac,
+                            locked=unlock,
+                            status="error",
+                            message=str(exc),
+                        ),
                     )
                     continue
-                rules = firewall.list_rules()
-                locked_after = locker.is_device_locked(device, rules)
-                result = {
-                    "mac": device.mac,
-                    "locked": locked_after,
-                    "status": "success",
-                    "message": "Locked device.",
-                }
-                results.append(result)
-                record_event(
-                    action="device_locked",
-                    subject_type="device",
-                    subject_id=device.mac,
-                    actor=actor,
-                    reason=reason,
-                    metadata={
-                        "status": result["status"],
-                        "message": result["message"],
-                        "unlock": unlock,
-                    },
+                outcomes[position] = (
+                    "device_unlocked" if unlock else "device_locked",
+                    ActionResult(
+                        mac=device.mac,
+                        locked=locked_after,
+                        status="success",
+                        message="Unlocked device." if unlock else "Locked device.",
+                    ),
                 )
+
+    results: list[ActionResult] = []
+    for position in sorted(outcomes):
+        action, result = outcomes[position]
+        results.append(result)
+        _record_lock_result(action, result, unlock=unlock, actor=actor, reason=reason)
     return results
 
 
 def get_unregistered_client_records() -> list[ClientRecord]:
     """Return active clients that are not registered in devices.py."""
-    device_repo = get_device_repository()
+    registered = get_device_repository().mac_index()
     with locker_context() as (firewall, locker):
         service = NetworkDeviceService(firewall.client)
-        clients = service.list_active_clients()
-        rules = firewall.list_rules()
+        clients = service.list_active_clients(exclude_macs=registered)
+        lock_index = build_lock_index(firewall.list_rules())
         records: list[ClientRecord] = []
 
         for client in clients:
             mac_value = client.get("mac")
             if not isinstance(mac_value, str):
                 continue
-            if device_repo.get_by_mac(mac_value):
-                continue
 
             vendor = lookup_mac_vendor(mac_value)
-            device = Device(
-                name=client.get("hostname")
-                or client.get("name")
-                or mac_value,
-                mac=mac_value,
-                type="unknown",
-                owner="unregistered",
-            )
-            locked = locker.is_device_locked(device, rules)
+            name = client.get("hostname") or client.get("name") or mac_value
+            locked = lock_index.is_mac_locked(mac_value, name)
             records.append(
-                {
-                    "name": device.name,
-                    "mac": mac_value,
-                    "ip": client.get("ip") or client.get("network"),
-                    "vendor": vendor,
-                    "last_seen": _timestamp_to_datetime(client.get("last_seen")),
-                    "locked": locked,
-                }
-        )
+                ClientRecord(
+                    name=name,
+                    mac=mac_value,
+                    ip=client.get("ip") or client.get("network"),
+                    vendor=vendor,
+                    last_seen=_timestamp_to_datetime(client.get("last_seen")),
+                    locked=locked,
+                )
+            )
 
         records.sort(
-            key=lambda item: item["last_seen"] or datetime.fromtimestamp(0, tz=UTC),
+            key=lambda item: item.last_seen or _EPOCH,
             reverse=True,
         )
         return records
 
 
+_DESTINATION_KEYS = (
+    "essid",
+    "ap_name",
+    "ap_mac",
+    "network",
+    "sw_name",
+    "sw_mac",
+    "gw_name",
+    "gw_mac",
+    "site_name",
+)
+
+
 def get_device_detail_record(
     mac: str,
     *,
     lookback_minutes: int = 60,
 ) -> DeviceDetailRecord:
     """Return enriched metadata for a registered device."""
-    mac_normalized = (mac or "").strip().lower()
+    mac_normalized = normalize_mac(mac or "")
     if not mac_normalized:
         raise KeyError("MAC address must be provided.")
 
@@ -652,28 +731,28 @@ def get_device_detail_record(
 
             for entry in active_clients:
                 entry_mac = entry.get("mac")
-                if isinstance(entry_mac, str) and entry_mac.lower() == mac_normalized:
+                if (
+                    isinstance(entry_mac, str)
+                    and normalize_mac(entry_mac) == mac_normalized
+                ):
                     active_info = entry
                     break
 
-        merged_info: Mapping[str, Any] | None = active_info or detail_info
+        source: Mapping[str, Any] = active_info or detail_info or {}
         online = active_info is not None
         ip_address = (
-            _extract_string(merged_info, "ip")
-            or _extract_string(merged_info, "fixed_ip")
-            or _extract_string(merged_info, "network")
+            _extract_string(source, "ip")
+            or _extract_string(source, "fixed_ip")
+            or _extract_string(source, "network")
         )
-        last_seen = _timestamp_to_datetime(
-            (merged_info or detail_info or {}).get("last_seen")
+        last_seen = _timestamp_to_datetime(source.get("last_seen"))
+        signal = _safe_float(source.get("signal"))
+        access_point = _extract_string(source, "ap_mac") or _extract_string(
+            source, "sw_mac"
         )
-        signal = _safe_float((merged_info or detail_info or {}).get("signal"))
-        access_point = _extract_string(merged_info or detail_info, "ap_mac") or _extract_string(
-            merged_info or detail_info, "sw_mac"
-        )
-        connection = _infer_connection_type(merged_info or detail_info)
-        network_name = (
-            _extract_string(merged_info or detail_info, "hostname")
-            or _extract_string(merged_info or detail_info, "name")
+        connection = _infer_connection_type(source)
+        network_name = _extract_string(source, "hostname") or _extract_string(
+            source, "name"
         )
 
         now_dt = datetime.now(tz=UTC).astimezone()
@@ -706,29 +785,20 @@ def get_device_detail_record(
             )
 
         destinations: list[str] = []
-        destination_candidates: list[str] = []
-        for payload in (merged_info, detail_info):
-            if isinstance(payload, Mapping):
-                destination_candidates.extend(
-                    [
-                        payload.get("essid"),
-                        payload.get("ap_name"),
-                        payload.get("ap_mac"),
-                        payload.get("network"),
-                        payload.get("sw_name"),
-                        payload.get("sw_mac"),
-                        payload.get("gw_name"),
-                        payload.get("gw_mac"),
-                        payload.get("site_name"),
-                    ]
-                )
+        payloads = (source,) if source is detail_info else (source, detail_info or {})
+        destination_candidates = [
+            payload.get(key) for payload in payloads for key in _DESTINATION_KEYS
+        ]
+        if access_point:
+            destination_candidates.append(access_point)
+        seen: set[str] = set()
         for value in destination_candidates:
             if isinstance(value, str):
                 normalized = value.strip()
-                if normalized and normalized.lower() not in {item.lower() for item in destinations}:
+                key = normalized.lower()
+                if key and key not in seen:
+                    seen.add(key)
                     destinations.append(normalized)
-        if access_point and access_point not in destinations:
-            destinations.append(access_point)
 
     return {
         "name": device.name,
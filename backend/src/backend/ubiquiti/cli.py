@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import argparse
 import json
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
 
 from .config import settings
 from .devices import Device, get_device_repository
 from .firewall import FirewallManager
-from .lock import DeviceLocker
+from .lock import DeviceLocker, build_lock_index
 from .network import NetworkDeviceService
 from .unifi import UniFiAPIError, UniFiClient
 from .utils import (
@@ -28,6 +28,16 @@ def _format_status(device: Device, locked: bool) -> str:
     return f" - {device.name}: {state}"
 
 
+def _last_seen_key(client_info: dict[str, object]) -> float:
+    # Missing timestamps sort last and still render as "unknown".
+    value = client_info.get("last_seen")
+    return float(value) if isinstance(value, (int, float)) else 0.0
+
+
+def _sort_by_last_seen(clients: list[dict[str, object]]) -> None:
+    clients.sort(key=_last_seen_key, reverse=True)
+
+
 def _format_timestamp(timestamp: float | int | None) -> str:
     if not timestamp:
         return "unknown"
@@ -83,13 +93,9 @@ def run(
             "Loaded devices for owner"
         )
         existing_rules = manager.list_rules()
+        existing_index = build_lock_index(existing_rules)
         for device in devices:
-            print_fn(
-                _format_status(
-                    device,
-                    locker.is_device_locked(device, existing_rules),
-                )
-            )
+            print_fn(_format_status(device, existing_index.is_locked(device)))
 
         if unlock:
             print_fn("Unlocking devices...")
@@ -106,13 +112,9 @@ def run(
 
         updated_rules = manager.list_rules()
         print_fn("Updated status:")
+        updated_index = build_lock_index(updated_rules)
         for device in devices:
-            print_fn(
-                _format_status(
-                    device,
-                    locker.is_device_locked(device, updated_rules),
-                )
-            )
+            print_fn(_format_status(device, updated_index.is_locked(device)))
     except UniFiAPIError as exc:
         logger.exception("UniFi API error encountered during {} flow", action)
         raise SystemExit(f"UniFi API error: {exc}") from exc
@@ -174,11 +176,12 @@ def list_active_devices(*, print_fn=print) -> None:
             logger.info("No active client devices returned by controller")
             return
 
-        clients = sorted(clients, key=lambda c: c.get("last_seen", 0), reverse=True)
+        _sort_by_last_seen(clients)
+        registered = get_device_repository().mac_index()
         _dump_json(
             {
                 "total": len(clients),
-                "clients": [_format_client_record(ci) for ci in clients],
+                "clients": [_format_client_record(ci, registered) for ci in clients],
             },
             print_fn=print_fn,
         )
@@ -231,12 +234,12 @@ def main(argv: Iterable[str] | None = None) -> None:
     run(args.owner, unlock=args.unlock)
 
 
-def _format_client_record(client_info: dict[str, object]) -> dict[str, object]:
+def _format_client_record(
+    client_info: dict[str, object], registered_devices: Mapping[str, Device]
+) -> dict[str, object]:
     mac = client_info.get("mac")
-    device_repo = get_device_repository()
-    registered = bool(device_repo.get_by_mac(mac if isinstance(mac, str) else None))
     mac_value = mac if isinstance(mac, str) else None
-    matched_device = device_repo.get_by_mac(mac_value)
+    matched_device = registered_devices.get(mac_value.lower()) if mac_value else None
     vendor = lookup_mac_vendor(mac_value)
     raw_last_seen = client_info.get("last_seen")
     if isinstance(raw_last_seen, (int, float)):
@@ -257,7 +260,7 @@ def _format_client_record(client_info: dict[str, object]) -> dict[str, object]:
         "ip": client_info.get("ip") or client_info.get("network"),
         "last_seen": _format_timestamp(last_seen_value),
         "access_point": client_info.get("ap_mac") or client_info.get("assoc_wlan"),
-        "registered": registered,
+        "registered": matched_device is not None,
     }
     if vendor:
         record["vendor"] = vendor
@@ -276,22 +279,19 @@ def list_non_registered_active_devices(*, print_fn=print) -> None:
     service = NetworkDeviceService(client)
 
     try:
-        clients = service.list_active_clients()
-        device_repo = get_device_repository()
-        unknown_clients = [
-            ci for ci in clients if not device_repo.get_by_mac(ci.get("mac"))
-        ]
+        registered = get_device_repository().mac_index()
+        unknown_clients = service.list_active_clients(exclude_macs=registered)
         if not unknown_clients:
             print_fn("No non-registered active client devices found.")
             logger.info("All active clients are registered")
             return
-        unknown_clients = sorted(
-            unknown_clients, key=lambda c: c.get("last_seen", 0), reverse=True
-        )
+        _sort_by_last_seen(unknown_clients)
         _dump_json(
             {
                 "total": len(unknown_clients),
-                "clients": [_format_client_record(ci) for ci in unknown_clients],
+                "clients": [
+                    _format_client_record(ci, registered) for ci in unknown_clients
+                ],
             },
             print_fn=print_fn,
         )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
@@ -11,6 +12,12 @@ from loguru import logger
 
 DEFAULT_BASE_URL = "https://10.0.0.1/proxy/network"
 
+# One KEY=value assignment per line; blank lines, comments and lines without "="
+# simply never match.
+_ENV_ASSIGNMENT = re.compile(
+    r"^[ \t]*([^#=\s][^=\r\n]*?)[ \t]*=([^\r\n]*)\r?$", re.MULTILINE
+)
+
 
 def _parse_bool(value: str) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
@@ -43,16 +50,13 @@ def _load_env_file(path: Path | None = None) -> None:
         return
 
     logger.bind(path=str(env_path)).info("Loading environment variables from .env")
-    for raw_line in env_path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
+    environ = os.environ
+    for key, value in _ENV_ASSIGNMENT.findall(env_path.read_text(encoding="utf-8")):
+        # Respect existing environment variables so runtime overrides win; their
+        # file values are never needed, so skip unquoting them.
+        if key in environ:
             continue
-
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        # Respect existing environment variables so runtime overrides win.
-        os.environ.setdefault(key, value)
+        environ[key] = value.strip().strip('"').strip("'")
 
 
 _load_env_file()
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from functools import lru_cache
+from types import MappingProxyType
 from typing import Protocol
 
 from sqlalchemy import select
@@ -15,7 +16,7 @@ from ..database import get_engine, get_session_factory, is_database_configured
 from ..db_models import DeviceModel
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Device:
     """Represents a known network device."""
 
@@ -37,6 +38,9 @@ class DeviceRepository(Protocol):
     def get_by_mac(self, mac: str | None) -> Device | None:
         ...
 
+    def mac_index(self) -> Mapping[str, Device]:
+        ...
+
     def register(self, device: Device) -> Device:
         ...
 
@@ -65,6 +69,10 @@ class InMemoryDeviceRepository(DeviceRepository):
             return None
         return self._by_mac.get(mac.lower())
 
+    def mac_index(self) -> Mapping[str, Device]:
+        # A read-only view of the live index, so it never goes stale after register().
+        return MappingProxyType(self._by_mac)
+
     def register(self, device: Device) -> Device:
         mac = device.mac.lower()
         owner = device.owner.lower()
@@ -91,7 +99,7 @@ class InMemoryDeviceRepository(DeviceRepository):
             self._devices.append(normalized)
 
         self._by_mac[mac] = normalized
-        self._by_owner.setdefault(owner, []).append(normalized)
+        self._by_owner[owner].append(normalized)
         return normalized
 
 
@@ -154,6 +162,19 @@ class SQLAlchemyDeviceRepository(DeviceRepository):
                 owner=row.owner_key,
             )
 
+    def mac_index(self) -> Mapping[str, Device]:
+        with self._session_factory() as session:
+            rows = session.execute(select(DeviceModel)).scalars().all()
+            return {
+                row.mac.lower(): Device(
+                    name=row.name,
+                    mac=row.mac,
+                    type=row.device_type,
+                    owner=row.owner_key,
+                )
+                for row in rows
+            }
+
     def register(self, device: Device) -> Device:
         mac = device.mac.lower()
         owner = device.owner.lower()
@@ -300,14 +321,27 @@ def _get_sql_repository() -> SQLAlchemyDeviceRepository:
     return _SQL_REPOSITORY
 
 
+_resolved_repository: DeviceRepository | None = None
+
+
 def get_device_repository() -> DeviceRepository:
     """Return the configured device repository."""
-    if is_database_configured() and get_engine() is not None:
-        try:
-            return _get_sql_repository()
-        except RuntimeError:
-            return _default_device_repository()
-    return _default_device_repository()
+    global _resolved_repository
+    if _resolved_repository is None:
+        if is_database_configured() and get_engine() is not None:
+            try:
+                _resolved_repository = _get_sql_repository()
+            except RuntimeError:
+                _resolved_repository = _default_device_repository()
+        else:
+            _resolved_repository = _default_device_repository()
+    return _resolved_repository
+
+
+def reset_device_repository() -> None:
+    """Forget the resolved repository so the next lookup re-reads configuration."""
+    global _resolved_repository
+    _resolved_repository = None
 
 
 def devices_by_owner(owner: str) -> Iterator[Device]:
@@ -327,6 +361,7 @@ __all__ = [
     "InMemoryDeviceRepository",
     "SQLAlchemyDeviceRepository",
     "get_device_repository",
+    "reset_device_repository",
     "devices_by_owner",
     "device_by_mac",
 ]
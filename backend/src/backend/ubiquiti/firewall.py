@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from threading import Lock
+from time import monotonic
 from typing import Any
 
 from .unifi import UniFiAPIError, UniFiClient
@@ -12,10 +14,22 @@ from .utils import logger, suppress_insecure_request_warning
 class FirewallManager:
     """High-level operations for UniFi firewall rules."""
 
-    def __init__(self, client: UniFiClient, *, site: str = "default") -> None:
+    def __init__(
+        self,
+        client: UniFiClient,
+        *,
+        site: str = "default",
+        rules_ttl: float = 2.0,
+    ) -> None:
         self._client = client
         self._site = site
         self._wan_group_id: str | None = None
+        # Short-lived snapshot so dashboard endpoints polled together share one
+        # controller round-trip. Mutations through this manager drop it.
+        self._rules_ttl = rules_ttl
+        self._rules_cache: tuple[float, list[Mapping[str, Any]]] | None = None
+        self._rules_cache_lock = Lock()
+        self._rules_generation = 0
 
     @property
     def site(self) -> str:
@@ -28,7 +42,12 @@ class FirewallManager:
     def create_rule(self, rule: Mapping[str, Any]) -> Mapping[str, Any]:
         """Create a firewall rule and return the created entity."""
         logger.bind(site=self._site).debug("Creating firewall rule")
-        response = self._client.request("post", self._base_endpoint(), json=dict(rule))
+        try:
+            response = self._client.request(
+                "post", self._base_endpoint(), json=dict(rule)
+            )
+        finally:
+            self._invalidate_rules_cache()
         created = self._extract_single(response) or {}
         logger.bind(site=self._site, rule_id=created.get("_id")).info(
             "Firewall rule created"
@@ -53,7 +72,12 @@ class FirewallManager:
     def delete_rule(self, rule_id: str) -> bool:
         """Delete a firewall rule and return True when acknowledged."""
         logger.bind(site=self._site, rule_id=rule_id).debug("Deleting firewall rule")
-        response = self._client.request("delete", f"{self._base_endpoint()}/{rule_id}")
+        try:
+            response = self._client.request(
+                "delete", f"{self._base_endpoint()}/{rule_id}"
+            )
+        finally:
+            self._invalidate_rules_cache()
         data = self._extract_payload(response)
         if isinstance(data, Mapping):
             rc = data.get("meta", {}).get("rc")
@@ -62,16 +86,39 @@ class FirewallManager:
         return True
 
     def list_rules(self) -> list[Mapping[str, Any]]:
-        """Return all firewall rules for the configured site."""
+        """Return all firewall rules for the configured site.
+
+        Results are reused for ``rules_ttl`` seconds unless a rule is created or
+        deleted through this manager in the meantime.
+        """
+        with self._rules_cache_lock:
+            cached = self._rules_cache
+            generation = self._rules_generation
+        if cached is not None and monotonic() - cached[0] < self._rules_ttl:
+            return list(cached[1])
+
         suppress_insecure_request_warning(self._client.verify_ssl)
         logger.bind(site=self._site).debug("Listing firewall rules")
+        fetched_at = monotonic()
         response = self._client.request("get", self._base_endpoint())
         data = self._extract_payload(response)
         if isinstance(data, list):
-            return list(data)
-        if data is None:
-            return []
-        return [data]
+            rules = list(data)
+        elif data is None:
+            rules = []
+        else:
+            rules = [data]
+        if self._rules_ttl > 0:
+            with self._rules_cache_lock:
+                # Skip storing if a mutation landed while this fetch was in flight.
+                if generation == self._rules_generation:
+                    self._rules_cache = (fetched_at, rules)
+        return list(rules)
+
+    def _invalidate_rules_cache(self) -> None:
+        with self._rules_cache_lock:
+            self._rules_cache = None
+            self._rules_generation += 1
 
     def get_wan_group_id(self) -> str | None:
         """Return the firewall group ID representing WAN destinations."""
@@ -10,6 +10,7 @@ from .firewall import FirewallManager
 from .utils import logger
 
 DEFAULT_RULESET = "LAN_IN"
+_RULE_NAME_PREFIX = "Block "
 
 
 @dataclass(frozen=True)
@@ -21,6 +22,37 @@ class LockOptions:
     description: str | None = "Generated by ubiquiti.lock.DeviceLocker"
 
 
+@dataclass(frozen=True)
+class LockIndex:
+    """Lookup of devices blocked by a firewall rule snapshot."""
+
+    macs: frozenset[str] = frozenset()
+    rule_names: frozenset[str] = frozenset()
+
+    def is_locked(self, device: Device) -> bool:
+        """Return True when a rule in the snapshot targets the device."""
+        return self.is_mac_locked(device.mac, device.name)
+
+    def is_mac_locked(self, mac: str, name: str) -> bool:
+        """Like :meth:`is_locked`, for callers that have no ``Device`` at hand."""
+        device_mac = mac.lower()
+        if device_mac and device_mac in self.macs:
+            return True
+        return f"{_RULE_NAME_PREFIX}{name}".lower() in self.rule_names
+
+
+def build_lock_index(rules: Iterable[Mapping[str, object]]) -> LockIndex:
+    """Walk ``rules`` once and index the MACs and rule names they block."""
+    macs: set[str] = set()
+    rule_names: set[str] = set()
+    for rule in rules:
+        macs.add(str(rule.get("src_mac_address", "")).lower())
+        macs.add(str(rule.get("src_mac", "")).lower())
+        rule_names.add(str(rule.get("name", "")).lower())
+    macs.discard("")
+    return LockIndex(macs=frozenset(macs), rule_names=frozenset(rule_names))
+
+
 class DeviceLocker:
     """Creates firewall rules that block devices from internet access."""
 
@@ -85,17 +117,37 @@ class DeviceLocker:
         )
         return rule
 
-    def lock_device(self, device: Device) -> Mapping[str, object]:
-        """Create a firewall rule that blocks a single device."""
-        existing_rules = list(self._firewall.list_rules())
-        rule_index = self._next_rule_index(existing_rules)
+    def lock_device(
+        self,
+        device: Device,
+        *,
+        rules: list[Mapping[str, object]] | None = None,
+        rule_index: int | None = None,
+    ) -> Mapping[str, object]:
+        """Create a firewall rule that blocks a single device.
+
+        When ``rules`` is supplied it is used as the current rule snapshot instead
+        of fetching one, and the created rule is appended to it in place. An
+        explicit ``rule_index`` skips the snapshot lookup for the next index.
+        """
+        if rule_index is None:
+            rule_index = self.next_rule_index(rules)
         rule = self.build_rule(device, rule_index=rule_index)
         created = self._firewall.create_rule(rule)
         logger.bind(device=device.name, rule_id=created.get("_id")).info(
             "Created firewall rule to lock device"
         )
+        if rules is not None:
+            rules.append({**rule, **created})
         return created
 
+    def next_rule_index(
+        self, rules: Iterable[Mapping[str, object]] | None = None
+    ) -> int:
+        """Return the rule index following the highest one in use."""
+        rule_iterable = rules if rules is not None else self._firewall.list_rules()
+        return self._next_rule_index(rule_iterable)
+
     def lock_devices(self, devices: Iterable[Device]) -> Iterable[Mapping[str, object]]:
         """Lock multiple devices, yielding each created rule."""
         existing_rules = list(self._firewall.list_rules())
@@ -121,16 +173,33 @@ class DeviceLocker:
         rules: Iterable[Mapping[str, object]] | None = None,
     ) -> bool:
         """Determine whether a blocking rule already exists for the device."""
-        return bool(self._matching_rules(device, rules))
+        rule_iterable = rules if rules is not None else self._firewall.list_rules()
+        return build_lock_index(rule_iterable).is_locked(device)
 
-    def unlock_device(self, device: Device) -> int:
+    def unlock_device(
+        self,
+        device: Device,
+        *,
+        rules: list[Mapping[str, object]] | None = None,
+    ) -> int:
         """Remove firewall rules blocking the given device, returning count removed."""
         logger.bind(device=device.name).debug("Unlocking single device")
-        return self.unlock_devices([device])
+        return self.unlock_devices([device], rules=rules)
 
-    def unlock_devices(self, devices: Iterable[Device]) -> int:
-        """Remove all blocking rules for the provided devices."""
-        remaining_rules: list[Mapping[str, object]] = list(self._firewall.list_rules())
+    def unlock_devices(
+        self,
+        devices: Iterable[Device],
+        *,
+        rules: list[Mapping[str, object]] | None = None,
+    ) -> int:
+        """Remove all blocking rules for the provided devices.
+
+        When ``rules`` is supplied it is used as the current rule snapshot instead
+        of fetching one, and deleted rules are removed from it in place.
+        """
+        remaining_rules: list[Mapping[str, object]] = (
+            rules if rules is not None else list(self._firewall.list_rules())
+        )
         removed = 0
         for device in devices:
             matches = self._matching_rules(device, remaining_rules)
@@ -140,7 +209,7 @@ class DeviceLocker:
                     continue
                 self._firewall.delete_rule(str(rule_id))
                 removed += 1
-                remaining_rules = [
+                remaining_rules[:] = [
                     r for r in remaining_rules if r.get("_id") != rule_id
                 ]
                 logger.bind(device=device.name, rule_id=rule_id).info(
@@ -202,7 +271,13 @@ class DeviceLocker:
 
     @staticmethod
     def _rule_name(device: Device) -> str:
-        return f"Block {device.name}"
+        return f"{_RULE_NAME_PREFIX}{device.name}"
 
 
-__all__ = ["DeviceLocker", "LockOptions", "DEFAULT_RULESET"]
+__all__ = [
+    "DeviceLocker",
+    "LockIndex",
+    "LockOptions",
+    "DEFAULT_RULESET",
+    "build_lock_index",
+]
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection, Sequence
 from datetime import UTC, datetime, timedelta
-from typing import Any, Literal, Sequence
+from typing import Any, Literal
 
 from .unifi import UniFiClient
-from .utils import logger, suppress_insecure_request_warning
+from .utils import logger, normalize_mac, suppress_insecure_request_warning
 
 
 class NetworkDeviceService:
@@ -30,11 +31,24 @@ class NetworkDeviceService:
         )
         return devices
 
-    def list_active_clients(self) -> list[dict[str, Any]]:
-        """Return all currently connected client devices."""
+    def list_active_clients(
+        self, *, exclude_macs: Collection[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Return all currently connected client devices.
+
+        Clients whose normalised MAC is in ``exclude_macs`` are dropped while the
+        response is unpacked; clients without a MAC are always kept.
+        """
         suppress_insecure_request_warning(self._client.verify_ssl)
         response = self._client.request("get", self._path("stat/sta"))
         clients = self._extract_data(response)
+        if exclude_macs:
+            clients = [
+                entry
+                for entry in clients
+                if not isinstance(mac := entry.get("mac"), str)
+                or normalize_mac(mac) not in exclude_macs
+            ]
         logger.bind(site=self._site, client_count=len(clients)).info(
             "Fetched active clients"
         )
@@ -7,6 +7,8 @@ from typing import Any
 
 import requests  # type: ignore[import-untyped]
 from requests import Response, Session
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+from urllib3.util.retry import Retry
 
 from .config import settings
 
@@ -26,12 +28,16 @@ class UniFiClient:
         api_key_header: str = "X-API-KEY",
         verify_ssl: bool = True,
         timeout: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: int = 2,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key or settings.unifi_api_key
         self.api_key_header = api_key_header
         self.verify_ssl = verify_ssl
         self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
         self._session: Session | None = None
 
     def establish_connection(self) -> Session:
@@ -41,6 +47,20 @@ class UniFiClient:
 
         session = requests.Session()
         session.verify = self.verify_ssl
+        # Keep enough pooled connections for concurrent lock actions. Failed
+        # connects are retried for any method since nothing reached the controller;
+        # read errors only for GET, so a rule create or delete is never replayed.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=Retry(
+                total=self.max_retries,
+                backoff_factor=0.2,
+                allowed_methods=frozenset({"GET"}),
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         header_value = self.api_key
         if (
             self.api_key_header.lower() == "authorization"
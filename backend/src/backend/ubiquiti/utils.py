@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import sys
 import warnings
+from functools import lru_cache
 
 from loguru import logger
 from mac_vendor_lookup import (  # type: ignore[import-untyped]
@@ -15,6 +16,7 @@ from urllib3.exceptions import InsecureRequestWarning
 
 _LOGGER_CONFIGURED = False
 _MAC_LOOKUP: MacLookup | None = None
+_MAC_SEPARATORS = str.maketrans("", "", ":-. ")
 
 
 def configure_logging(*, force: bool = False) -> None:
@@ -56,11 +58,8 @@ def suppress_insecure_request_warning(verify_ssl: bool) -> None:
     )
 
 
-def lookup_mac_vendor(mac: str | None) -> str | None:
-    """Return the vendor/manufacturer name for the provided MAC address."""
-    if not mac:
-        return None
-
+def _get_mac_lookup() -> MacLookup | None:
+    """Return the process-wide vendor database, loading it on first use."""
     global _MAC_LOOKUP
     if _MAC_LOOKUP is None:
         lookup = MacLookup()
@@ -85,15 +84,41 @@ def lookup_mac_vendor(mac: str | None) -> str | None:
                 "Loaded MAC vendor database"
             )
         _MAC_LOOKUP = lookup
+    return _MAC_LOOKUP
 
+
+@lru_cache(maxsize=4096)
+def _lookup_oui_vendor(lookup: MacLookup, oui: str) -> str | None:
+    # Vendors are assigned per OUI (first three octets), so every MAC sharing a
+    # prefix resolves to the same answer. Only definitive answers are cached;
+    # other errors propagate so the next call tries again.
     try:
-        return _MAC_LOOKUP.lookup(mac)
+        return lookup.lookup(oui)
     except (KeyError, VendorNotFoundError):
         return None
-    except Exception as exc:  # pragma: no cover - unexpected failure
-        logger.debug("MAC vendor lookup failed for {}: {}", mac, exc)
+
+
+def lookup_mac_vendor(mac: str | None) -> str | None:
+    """Return the vendor/manufacturer name for the provided MAC address."""
+    if not mac:
+        return None
+
+    lookup = _get_mac_lookup()
+    if lookup is None:
         return None
 
+    oui = mac.translate(_MAC_SEPARATORS)[:6].upper()
+    try:
+        return _lookup_oui_vendor(lookup, oui)
+    except Exception as exc:
+        logger.debug("MAC vendor lookup failed for {}: {}", oui, exc)
+        return None
+
+
+def normalize_mac(mac: str) -> str:
+    """Return the trimmed, lower-case form used to store and compare MACs."""
+    return mac.strip().lower()
+
 
 configure_logging()
 
@@ -101,5 +126,6 @@ __all__ = [
     "configure_logging",
     "suppress_insecure_request_warning",
     "lookup_mac_vendor",
+    "normalize_mac",
     "logger",
 ]
@@ -33,6 +33,9 @@ class StubDeviceRepository:
             return None
         return self._by_mac.get(mac.lower())
 
+    def mac_index(self) -> dict[str, Device]:
+        return dict(self._by_mac)
+
 
 class DummyClient:
     def __init__(
@@ -185,8 +188,9 @@ class DummyNetworkService:
     def list_devices(self):
         return list(self.devices)
 
-    def list_active_clients(self):
-        return list(self.clients)
+    def list_active_clients(self, *, exclude_macs=None):
+        excluded = exclude_macs or ()
+        return [ci for ci in self.clients if ci.get("mac", "").lower() not in excluded]
 
 
 def test_cli_list_devices(monkeypatch, capsys):
@@ -253,6 +257,39 @@ def test_cli_list_active_devices(monkeypatch, capsys):
     assert data["clients"][0]["vendor"] == "VendorOne"
 
 
+def test_cli_list_active_devices_sorts_missing_last_seen_last(monkeypatch, capsys):
+    monkeypatch.setattr("backend.ubiquiti.cli.UniFiClient", DummyClient)
+    service = DummyNetworkService(None)
+    service.clients = [
+        {"name": "Never", "mac": "11:22:33"},
+        {"name": "Older", "mac": "44:55:66", "last_seen": 1_699_999_999},
+        {"name": "Unknown", "mac": "77:88:99", "last_seen": None},
+        {"name": "Newer", "mac": "aa:bb:cc", "last_seen": 1_700_000_000},
+    ]
+    monkeypatch.setattr(
+        "backend.ubiquiti.cli.NetworkDeviceService",
+        lambda client: service,
+    )
+    monkeypatch.setattr(
+        "backend.ubiquiti.cli.get_device_repository",
+        lambda: StubDeviceRepository([]),
+    )
+    monkeypatch.setattr("backend.ubiquiti.cli.lookup_mac_vendor", lambda mac: None)
+
+    list_active_devices(print_fn=print)
+    data = json.loads(capsys.readouterr().out.strip())
+
+    assert [c["name"] for c in data["clients"]] == [
+        "Newer",
+        "Older",
+        "Never",
+        "Unknown",
+    ]
+    assert data["clients"][2]["last_seen"] == "unknown"
+    # Sorting must not write defaults back into the controller's client records.
+    assert "last_seen" not in service.clients[0]
+
+
 def test_cli_main_list_devices(monkeypatch, capsys):
     monkeypatch.setattr(
         "backend.ubiquiti.cli.list_devices",
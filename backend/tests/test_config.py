@@ -54,3 +54,35 @@ def test_missing_api_key_raises_runtime_error(tmp_path, monkeypatch):
 
     with pytest.raises(RuntimeError, match="UNIFI_API_KEY is not set"):
         _reload_config(monkeypatch, env_file)
+
+
+def test_env_file_parsing_handles_comments_quotes_and_crlf(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_bytes(
+        b"# comment line\r\n"
+        b"\r\n"
+        b"UNIFI_API_KEY = \"quoted-key\"\r\n"
+        b"  UNIFI_BASE_URL='https://controller/a=b'\r\n"
+        b"not an assignment\r\n"
+    )
+    # Register the variable with monkeypatch so the value loaded here is undone.
+    monkeypatch.setenv("UNIFI_BASE_URL", "")
+    monkeypatch.delenv("UNIFI_BASE_URL")
+
+    config = _reload_config(monkeypatch, env_file)
+
+    assert config.settings.unifi_api_key == "quoted-key"
+    assert config.settings.unifi_base_url == "https://controller/a=b"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"), [("250", 250), ("lots", 5000), ("-1", 5000)]
+)
+def test_database_query_cache_size_falls_back_on_invalid_values(
+    monkeypatch, raw, expected
+):
+    from backend.database import DatabaseSettings
+
+    monkeypatch.setenv("UBIQUITI_DB_QUERY_CACHE_SIZE", raw)
+
+    assert DatabaseSettings.load().query_cache_size == expected
@@ -137,3 +137,23 @@ def test_device_detail_unknown_mac_returns_404(monkeypatch):
     encoded_mac = quote("11:22:33:44:55:66", safe="")
     response = client.get(f"/api/devices/{encoded_mac}/detail")
     assert response.status_code == 404
+
+
+def test_traffic_summary_downsamples_long_windows():
+    from backend.services import _TRAFFIC_SAMPLE_LIMIT, _build_traffic_summary
+
+    entries = [
+        {"time": 1_700_000_000_000 + index * 300_000, "rx_bytes": 100, "tx_bytes": 10}
+        for index in range(288)
+    ]
+    entries[150]["rx_bytes"] = 1_000_000
+
+    summary = _build_traffic_summary(entries, 24 * 60)
+
+    assert summary is not None
+    samples = summary["samples"]
+    assert len(samples) == _TRAFFIC_SAMPLE_LIMIT
+    assert summary["total_rx_bytes"] == 287 * 100 + 1_000_000
+    assert samples[0]["timestamp"] == summary["start"]
+    assert samples[-1]["timestamp"] == summary["end"]
+    assert max(sample["rx_bytes"] for sample in samples) == 1_000_000
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.db_models import Base
 from backend.ubiquiti.devices import (
     DEVICES,
     Device,
     InMemoryDeviceRepository,
+    SQLAlchemyDeviceRepository,
     devices_by_owner,
 )
 
@@ -59,3 +64,37 @@ def test_in_memory_repository_updates_existing_device_owner():
     assert repo.get_by_mac(mac).owner == "jayce"
     assert repo.list_by_owner("jayce") == [updated]
     assert repo.list_by_owner("kade") == []
+
+
+def test_in_memory_mac_index_tracks_registrations():
+    repo = InMemoryDeviceRepository([])
+    index = repo.mac_index()
+    assert dict(index) == {}
+
+    saved = repo.register(
+        Device(name="Console", mac="AA:BB:CC:DD:EE:01", type="xbox", owner="kade")
+    )
+
+    assert index["aa:bb:cc:dd:ee:01"] == saved
+
+
+def test_sql_list_by_owner_uses_owner_index(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'devices.db'}")
+    Base.metadata.create_all(engine)
+    repo = SQLAlchemyDeviceRepository(sessionmaker(bind=engine))
+    statements: list[tuple[str, object]] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, params, context, executemany: (
+            statements.append((statement, params))
+        ),
+    )
+
+    repo.list_by_owner("Kade")
+
+    [(statement, params)] = statements
+    with engine.connect() as connection:
+        plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", params)
+        details = [row[-1] for row in plan]
+    assert any("ix_devices_owner_key" in detail for detail in details)
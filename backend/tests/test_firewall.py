@@ -107,3 +107,23 @@ def test_list_rules_returns_list():
 
     assert [rule["_id"] for rule in rules] == ["rule1", "rule2"]
     assert client.calls[0]["method"] == "get"
+
+
+def test_list_rules_reuses_snapshot_until_mutation():
+    client = DummyClient(
+        [
+            DummyResponse({"data": [{"_id": "rule1"}]}),
+            DummyResponse({"data": [{"_id": "rule2"}]}),
+            DummyResponse({"data": [{"_id": "rule1"}, {"_id": "rule2"}]}),
+        ]
+    )
+    manager = FirewallManager(client)
+
+    first = manager.list_rules()
+    second = manager.list_rules()
+    manager.create_rule({"name": "Block"})
+    third = manager.list_rules()
+
+    assert first == second == [{"_id": "rule1"}]
+    assert [rule["_id"] for rule in third] == ["rule1", "rule2"]
+    assert [call["method"] for call in client.calls] == ["get", "post", "get"]
@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
+from contextlib import contextmanager
 from typing import Any
 
+from backend import services
 from backend.ubiquiti.devices import DEVICES, Device
-from backend.ubiquiti.lock import DEFAULT_RULESET, DeviceLocker, LockOptions
+from backend.ubiquiti.lock import (
+    DEFAULT_RULESET,
+    DeviceLocker,
+    LockOptions,
+    build_lock_index,
+)
+from backend.ubiquiti.unifi import UniFiAPIError
 
 
 class DummyFirewall:
@@ -122,6 +130,21 @@ def test_is_device_locked_detects_by_mac():
     assert locker.is_device_locked(DEVICE, rules) is True
 
 
+def test_build_lock_index_matches_by_mac_and_rule_name():
+    other = Device("Other Device", "00:11:22:33:44:55", "phone", "user")
+    named = Device("Named Device", "66:77:88:99:aa:bb", "phone", "user")
+    index = build_lock_index(
+        [
+            {"src_mac": DEVICE.mac.upper()},
+            {"name": DeviceLocker._rule_name(named)},
+        ]
+    )
+
+    assert index.is_locked(DEVICE) is True
+    assert index.is_locked(named) is True
+    assert index.is_locked(other) is False
+
+
 def test_lock_device_respects_existing_rule_index():
     firewall = DummyFirewall()
     firewall.rules = [{"_id": "existing", "rule_index": 20050}]
@@ -179,3 +202,118 @@ def test_unlock_owner_uses_devices_by_owner(monkeypatch):
 
     assert removed == 2
     assert set(firewall.deleted) == {"rule-1", "rule-2"}
+
+
+def test_lock_and_unlock_maintain_supplied_rule_snapshot():
+    firewall = DummyFirewall(response={"_id": "rule-2"})
+    firewall.rules = [{"_id": "existing", "rule_index": 20050}]
+    locker = DeviceLocker(firewall)
+    rules = firewall.list_rules()
+
+    locker.lock_device(DEVICE, rules=rules)
+
+    assert firewall.created[0]["rule_index"] == 20051
+    assert locker.is_device_locked(DEVICE, rules) is True
+
+    removed = locker.unlock_device(DEVICE, rules=rules)
+
+    assert removed == 1
+    assert locker.is_device_locked(DEVICE, rules) is False
+    assert [rule["_id"] for rule in rules] == ["existing"]
+
+
+def test_lock_index_checks_mac_and_name_without_device():
+    index = build_lock_index([{"name": "Block Guest Phone"}])
+
+    assert index.is_mac_locked("00:11:22:33:44:55", "Guest Phone") is True
+    assert index.is_mac_locked("00:11:22:33:44:55", "Other") is False
+
+
+class FlakyFirewall(DummyFirewall):
+    def __init__(self, failing_macs: set[str]) -> None:
+        super().__init__()
+        self.failing_macs = failing_macs
+
+    def create_rule(self, rule: Mapping[str, Any]) -> Mapping[str, Any]:
+        if rule["src_mac"] in self.failing_macs:
+            raise UniFiAPIError("controller rejected rule")
+        return super().create_rule(rule)
+
+    def delete_rule(self, rule_id: str) -> bool:
+        if rule_id in self.failing_macs:
+            raise UniFiAPIError("controller rejected delete")
+        return super().delete_rule(rule_id)
+
+
+def _patch_lock_services(monkeypatch, firewall: DummyFirewall) -> list[dict[str, Any]]:
+    @contextmanager
+    def fake_locker_context():
+        yield firewall, DeviceLocker(firewall)
+
+    events: list[dict[str, Any]] = []
+    monkeypatch.setattr(services, "locker_context", fake_locker_context)
+    monkeypatch.setattr(
+        services, "record_event", lambda **kwargs: events.append(kwargs)
+    )
+    return events
+
+
+def _device(name: str, mac: str) -> Device:
+    return Device(name=name, mac=mac, type="computer", owner="user")
+
+
+def test_apply_lock_action_reports_mixed_results_in_device_order(monkeypatch):
+    failing = _device("Failing", "00:00:00:00:00:01")
+    locked = _device("Locked", "00:00:00:00:00:02")
+    first = _device("First", "00:00:00:00:00:03")
+    second = _device("Second", "00:00:00:00:00:04")
+    firewall = FlakyFirewall({failing.mac})
+    firewall.rules = [{"_id": "existing", "src_mac": locked.mac, "rule_index": 20050}]
+    events = _patch_lock_services(monkeypatch, firewall)
+
+    results = services.apply_lock_action(
+        [failing, locked, first, second], unlock=False, actor="tester"
+    )
+
+    assert [(result.mac, result.status, result.locked) for result in results] == [
+        (failing.mac, "error", False),
+        (locked.mac, "skipped", True),
+        (first.mac, "success", True),
+        (second.mac, "success", True),
+    ]
+    assert results[0].message == "controller rejected rule"
+    assert [(event["action"], event["subject_id"]) for event in events] == [
+        ("device_lock_failed", failing.mac),
+        ("device_lock_skipped", locked.mac),
+        ("device_locked", first.mac),
+        ("device_locked", second.mac),
+    ]
+    # The failed lock's reserved index stays unused; the others keep device order.
+    indexes = {rule["src_mac"]: rule["rule_index"] for rule in firewall.created}
+    assert indexes == {first.mac: 20052, second.mac: 20053}
+
+
+def test_apply_lock_action_unlock_keeps_order_when_a_delete_fails(monkeypatch):
+    stuck = _device("Stuck", "00:00:00:00:00:01")
+    unlocked = _device("Unlocked", "00:00:00:00:00:02")
+    freed = _device("Freed", "00:00:00:00:00:03")
+    firewall = FlakyFirewall({"stuck-rule"})
+    firewall.rules = [
+        {"_id": "stuck-rule", "src_mac": stuck.mac, "rule_index": 20001},
+        {"_id": "freed-rule", "src_mac": freed.mac, "rule_index": 20002},
+    ]
+    events = _patch_lock_services(monkeypatch, firewall)
+
+    results = services.apply_lock_action([stuck, unlocked, freed], unlock=True)
+
+    assert [(result.mac, result.status, result.locked) for result in results] == [
+        (stuck.mac, "error", True),
+        (unlocked.mac, "skipped", False),
+        (freed.mac, "success", False),
+    ]
+    assert [event["action"] for event in events] == [
+        "device_unlock_failed",
+        "device_unlock_skipped",
+        "device_unlocked",
+    ]
+    assert firewall.deleted == ["freed-rule"]
@@ -91,3 +91,26 @@ def test_owner_creation_logs_event(monkeypatch):
         entry["action"] == "owner_created" and entry.get("actor") == "auditor"
         for entry in entries
     )
+
+
+def test_service_records_match_response_schemas():
+    # The router builds these schemas with model_construct, which skips
+    # validation, so the service records must keep the same fields and types.
+    from dataclasses import fields
+    from typing import get_type_hints
+
+    from backend import schemas, services
+
+    pairs = [
+        (services.DeviceRecord, schemas.DeviceStatus),
+        (services.ClientRecord, schemas.UnregisteredClient),
+        (services.ActionResult, schemas.DeviceActionResult),
+        (services.OwnerSummaryRecord, schemas.OwnerSummary),
+    ]
+    for record_type, schema in pairs:
+        hints = get_type_hints(record_type)
+        record_fields = {field.name: hints[field.name] for field in fields(record_type)}
+        schema_fields = {
+            name: info.annotation for name, info in schema.model_fields.items()
+        }
+        assert record_fields == schema_fields, record_type.__name__
@@ -0,0 +1,358 @@
+"""Tests for the SQL-backed schedule repository on an in-memory SQLite engine."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import schedules
+from backend.db_models import Base
+from backend.schemas import (
+    ScheduleConfig,
+    ScheduleCreateRequest,
+    ScheduleMetadata,
+    ScheduleUpdateRequest,
+)
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    # Mirror the session options used by backend.database.get_session_factory().
+    session_factory = sessionmaker(
+        bind=engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+    )
+    monkeypatch.setattr(schedules, "get_session_factory", lambda: session_factory)
+    yield schedules.SqlScheduleRepository()
+    engine.dispose()
+
+
+def _create(repo, owner: str, label: str, **overrides):
+    payload = {
+        "scope": "owner",
+        "ownerKey": owner,
+        "label": label,
+        "targets": {"devices": [], "tags": [f"{owner}-all"]},
+        "action": "unlock",
+        "endAction": "lock",
+        "window": {
+            "start": "2025-12-01T15:00:00+00:00",
+            "end": "2025-12-01T17:00:00+00:00",
+        },
+        "recurrence": {"type": "one_shot"},
+        "enabled": True,
+    }
+    payload.update(overrides)
+    return repo.create(ScheduleCreateRequest.model_validate(payload))
+
+
+def _enabled(repo, *schedule_ids: str) -> list[bool]:
+    return [repo.get(schedule_id).enabled for schedule_id in schedule_ids]
+
+
+def test_create_active_group_enables_its_schedules(repo):
+    first = _create(repo, "kade", "Weekday")
+    second = _create(repo, "kade", "Weekend")
+
+    record, members = repo.create_group(
+        "School",
+        owner_key="kade",
+        description=None,
+        schedule_ids=[first.id],
+        is_active=True,
+    )
+    repo.create_group(
+        "Summer",
+        owner_key="kade",
+        description=None,
+        schedule_ids=[second.id],
+        is_active=False,
+    )
+
+    assert record.is_active is True
+    assert [schedule.enabled for schedule in members] == [True]
+    assert _enabled(repo, first.id, second.id) == [True, False]
+
+
+def test_switching_active_group_moves_enabled_schedules(repo):
+    first = _create(repo, "kade", "Weekday")
+    second = _create(repo, "kade", "Weekend")
+    school, _ = repo.create_group(
+        "School",
+        owner_key="kade",
+        description=None,
+        schedule_ids=[first.id],
+        is_active=True,
+    )
+    summer, _ = repo.create_group(
+        "Summer",
+        owner_key="kade",
+        description=None,
+        schedule_ids=[second.id],
+        is_active=False,
+    )
+
+    record, members = repo.set_group_active(summer.id, True)
+
+    assert record.is_active is True
+    assert [schedule.enabled for schedule in members] == [True]
+    assert repo.get_group(school.id)[0].is_active is False
+    assert _enabled(repo, first.id, second.id) == [False, True]
+
+
+def test_deactivating_group_disables_its_schedules(repo):
+    first = _create(repo, "kade", "Weekday")
+    second = _create(repo, "kade", "Weekend")
+    school, _ = repo.create_group(
+        "School",
+        owner_key="kade",
+        description=None,
+        schedule_ids=[first.id],
+        is_active=True,
+    )
+    summer, _ = repo.create_group(
+        "Summer",
+        owner_key="kade",
+        description=None,
+        schedule_ids=[second.id],
+        is_active=True,
+    )
+
+    record, members = repo.set_group_active(summer.id, False)
+    assert record.is_active is False
+    assert [schedule.enabled for schedule in members] == [False]
+
+    record, members = repo.update_group(school.id, is_active=True)
+    assert _enabled(repo, first.id, second.id) == [True, False]
+
+    record, members = repo.update_group(school.id, is_active=False)
+    assert record.is_active is False
+    assert _enabled(repo, first.id, second.id) == [False, False]
+
+
+def test_set_enabled_cannot_enable_schedule_of_inactive_group(repo):
+    grouped = _create(repo, "kade", "Weekday")
+    loose = _create(repo, "kade", "Weekend", enabled=False)
+    repo.create_group(
+        "School",
+        owner_key="kade",
+        description=None,
+        schedule_ids=[grouped.id],
+        is_active=False,
+    )
+
+    assert repo.set_enabled(grouped.id, True).enabled is False
+    assert repo.set_enabled(loose.id, True).enabled is True
+    assert repo.set_enabled("missing", True) is None
+    assert _enabled(repo, grouped.id, loose.id) == [False, True]
+
+
+def test_reads_are_not_cached_outside_a_request_scope(repo):
+    created = _create(repo, "kade", "Weekday")
+    other_worker = schedules.SqlScheduleRepository()
+
+    assert repo.get(created.id).enabled is True
+    other_worker.set_enabled(created.id, False)
+
+    assert repo.get(created.id).enabled is False
+
+
+def test_request_scope_memoises_reads_until_a_write(repo):
+    created = _create(repo, "kade", "Weekday")
+    other_worker = schedules.SqlScheduleRepository()
+
+    with schedules.schedule_read_scope():
+        first = repo.get(created.id)
+        owner_rows, _ = repo.list_for_owner("kade")
+        with schedules.schedule_read_scope():
+            other_worker.set_enabled(created.id, False)
+
+        # Served from this request's cache, as independent copies.
+        first.label = "Mutated"
+        owner_rows.clear()
+        again = repo.get(created.id)
+        assert again.label == "Weekday"
+        assert again.enabled is True
+        assert [schedule.id for schedule in repo.list_for_owner("kade")[0]] == [
+            created.id
+        ]
+
+        # A write through the repository drops the request's entries.
+        repo.update(created.id, ScheduleUpdateRequest.model_validate({"label": "New"}))
+        assert repo.get(created.id).label == "New"
+        assert repo.get(created.id).enabled is False
+
+    assert repo.get(created.id).enabled is False
+
+
+def _config(*schedules, timezone: str = "Europe/London") -> ScheduleConfig:
+    return ScheduleConfig(
+        metadata=ScheduleMetadata.model_validate(
+            {"timezone": timezone, "generatedAt": "2025-12-01T00:00:00+00:00"}
+        ),
+        schedules=list(schedules),
+    )
+
+
+def test_sync_from_config_merge_keeps_existing_rows(repo):
+    existing = _create(repo, "kade", "Weekday")
+    incoming = existing.model_copy(update={"label": "Overwritten"})
+    added = existing.model_copy(update={"id": "added", "label": "Added"})
+    duplicate = added.model_copy(update={"label": "Added again"})
+
+    repo.sync_from_config(_config(incoming, added, duplicate), replace=False)
+
+    assert repo.get(existing.id).label == "Weekday"
+    assert repo.get("added").label == "Added again"
+    assert repo.get_metadata().timezone == "Europe/London"
+
+    repo.sync_from_config(_config(timezone="America/Chicago"), replace=False)
+    assert repo.get_metadata().timezone == "America/Chicago"
+
+
+def test_sync_from_config_replace_clears_schedules_and_groups(repo):
+    existing = _create(repo, "kade", "Weekday")
+    repo.create_group(
+        "School",
+        owner_key="kade",
+        description=None,
+        schedule_ids=[existing.id],
+        is_active=True,
+    )
+    replacement = existing.model_copy(
+        update={"id": "replacement", "label": "Replacement", "group_ids": []}
+    )
+
+    repo.sync_from_config(_config(replacement), replace=True)
+
+    assert repo.get(existing.id) is None
+    assert [schedule.id for schedule in repo.list()] == ["replacement"]
+    assert repo.list_groups("kade") == []
+
+
+def test_copy_owner_schedules_merge_and_replace(repo):
+    first = _create(repo, "kade", "Weekday")
+    _create(repo, "kade", "Weekend")
+    _create(repo, "ava", "Homework")
+
+    created, replaced = repo.copy_owner_schedules("KADE", "ava", mode="merge")
+    assert replaced == 0
+    assert sorted(schedule.label for schedule in created) == ["Weekday", "Weekend"]
+    assert all(schedule.owner_key == "ava" for schedule in created)
+    assert first.id not in {schedule.id for schedule in created}
+    assert len(repo.list_for_owner("ava")[0]) == 3
+
+    created, replaced = repo.copy_owner_schedules("kade", "ava", mode="replace")
+    assert replaced == 3
+    assert sorted(schedule.label for schedule in repo.list_for_owner("ava")[0]) == [
+        "Weekday",
+        "Weekend",
+    ]
+    assert len(repo.list_for_owner("kade")[0]) == 2
+
+    assert repo.copy_owner_schedules("nobody", "ava", mode="replace") == ([], 0)
+
+
+def test_clone_copies_schedule_to_new_owner(repo):
+    source = _create(repo, "kade", "Weekday")
+
+    clone = repo.clone(source.id, "ava")
+
+    assert clone is not None
+    assert clone.id != source.id
+    assert clone.owner_key == "ava"
+    assert clone.label == source.label
+    assert repo.get(clone.id) == clone
+    assert repo.clone("missing", "ava") is None
+
+
+def test_update_and_delete_schedule(repo):
+    schedule = _create(repo, "kade", "Weekday")
+    school, _ = repo.create_group(
+        "School",
+        owner_key="kade",
+        description=None,
+        schedule_ids=[],
+        is_active=False,
+    )
+
+    updated = repo.update(
+        schedule.id,
+        ScheduleUpdateRequest.model_validate(
+            {"label": "School days", "groupIds": [school.id]}
+        ),
+    )
+
+    assert updated.label == "School days"
+    assert updated.group_ids == [school.id]
+    assert updated.enabled is False
+    assert repo.get(schedule.id) == updated
+
+    assert repo.delete(schedule.id) is True
+    assert repo.delete(schedule.id) is False
+    assert repo.get(schedule.id) is None
+    assert repo.get_group(school.id)[1] == []
+
+
+def test_list_and_delete_groups(repo):
+    first = _create(repo, "kade", "Weekday")
+    school, _ = repo.create_group(
+        " School ",
+        owner_key="KADE",
+        description=" Term time ",
+        schedule_ids=[first.id],
+        is_active=True,
+    )
+
+    groups = repo.list_groups("kade")
+    assert [(record.name, record.description) for record, _ in groups] == [
+        ("School", "Term time")
+    ]
+    assert [schedule.id for schedule in groups[0][1]] == [first.id]
+    assert repo.list_groups(None) == []
+
+    assert repo.delete_group(school.id) is True
+    assert repo.delete_group(school.id) is False
+    assert repo.list_groups("kade") == []
+    assert repo.get(first.id).group_ids == []
+
+
+def test_request_scope_memoises_metadata_until_a_write(repo):
+    other_worker = schedules.SqlScheduleRepository()
+    original = repo.get_metadata()
+
+    with schedules.schedule_read_scope():
+        assert repo.get_metadata() == original
+        with schedules.schedule_read_scope():
+            other_worker.sync_from_config(
+                _config(timezone="America/Chicago"), replace=False
+            )
+        assert repo.get_metadata().timezone == original.timezone
+
+        _create(repo, "kade", "Weekday")
+        assert repo.get_metadata().timezone == "America/Chicago"
+
+    assert repo.get_metadata().timezone == "America/Chicago"
+
+
+def test_set_enabled_without_update_returning(repo, monkeypatch):
+    created = _create(repo, "kade", "Weekday")
+    with repo._session() as session:
+        dialect = session.get_bind().dialect
+    monkeypatch.setattr(dialect, "update_returning", False)
+
+    updated = repo.set_enabled(created.id, False)
+
+    assert updated.enabled is False
+    assert updated.updated_at >= created.updated_at
+    assert repo.get(created.id) == updated
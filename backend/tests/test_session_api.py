@@ -9,6 +9,7 @@ os.environ["UBIQUITI_DB_MODE"] = "memory"
 os.environ["UBIQUITI_DB_URL"] = ""
 
 from backend.app import app  # noqa: E402
+from backend.services import ClientRecord  # noqa: E402
 
 
 client = TestClient(app)
@@ -16,22 +17,22 @@ client = TestClient(app)
 
 def test_session_whoami_returns_probable_matches(monkeypatch):
     sample_clients = [
-        {
-            "name": "Living Room Tablet",
-            "mac": "aa:bb:cc:dd:ee:ff",
-            "ip": "10.0.0.5",
-            "vendor": "Acme",
-            "last_seen": None,
-            "locked": False,
-        },
-        {
-            "name": "Other Device",
-            "mac": "11:22:33:44:55:66",
-            "ip": "10.0.0.10",
-            "vendor": "Other",
-            "last_seen": None,
-            "locked": False,
-        },
+        ClientRecord(
+            name="Living Room Tablet",
+            mac="aa:bb:cc:dd:ee:ff",
+            ip="10.0.0.5",
+            vendor="Acme",
+            last_seen=None,
+            locked=False,
+        ),
+        ClientRecord(
+            name="Other Device",
+            mac="11:22:33:44:55:66",
+            ip="10.0.0.10",
+            vendor="Other",
+            last_seen=None,
+            locked=False,
+        ),
     ]
 
     monkeypatch.setattr(
@@ -28,6 +28,10 @@ class DummySession:
         self.verify: bool | None = None
         self.calls: list[dict[str, Any]] = []
         self.closed = False
+        self.adapters: dict[str, Any] = {}
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        self.adapters[prefix] = adapter
 
     def request(self, **kwargs: Any) -> DummyResponse:
         self.calls.append(kwargs)
@@ -69,6 +73,24 @@ def test_establish_connection_configures_session(tmp_path, monkeypatch):
     assert client.establish_connection() is session
 
 
+def test_establish_connection_mounts_pooled_adapter(tmp_path, monkeypatch):
+    unifi_module, _ = _reload_unifi(monkeypatch, tmp_path, api_key="abc123")
+
+    session = DummySession(DummyResponse(ok=True))
+    monkeypatch.setattr(unifi_module.requests, "Session", lambda: session)
+
+    client = unifi_module.UniFiClient(
+        "https://controller.example", pool_maxsize=16, max_retries=3
+    )
+    client.establish_connection()
+
+    adapter = session.adapters["https://"]
+    assert session.adapters["http://"] is adapter
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.allowed_methods == frozenset({"GET"})
+
+
 def test_request_success(tmp_path, monkeypatch):
     unifi_module, _ = _reload_unifi(monkeypatch, tmp_path, api_key="xyz789")
 
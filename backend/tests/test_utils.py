@@ -0,0 +1,36 @@
+"""Tests for the shared UniFi helper utilities."""
+
+from __future__ import annotations
+
+from mac_vendor_lookup import VendorNotFoundError
+
+from backend.ubiquiti import utils
+
+
+class FlakyLookup:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def lookup(self, oui: str) -> str:
+        self.calls.append(oui)
+        if oui == "000000":
+            raise VendorNotFoundError(oui)
+        if len(self.calls) == 1:
+            raise RuntimeError("vendor database busy")
+        return "Acme Networks"
+
+
+def test_lookup_mac_vendor_retries_after_transient_failure(monkeypatch):
+    lookup = FlakyLookup()
+    monkeypatch.setattr(utils, "_get_mac_lookup", lambda: lookup)
+    utils._lookup_oui_vendor.cache_clear()
+
+    assert utils.lookup_mac_vendor("28:16:a8:ae:27:57") is None
+    assert utils.lookup_mac_vendor("28-16-A8-00-00-01") == "Acme Networks"
+    assert utils.lookup_mac_vendor("28:16:a8:11:22:33") == "Acme Networks"
+    assert lookup.calls == ["2816A8", "2816A8"]
+
+    assert utils.lookup_mac_vendor("00:00:00:aa:bb:cc") is None
+    assert utils.lookup_mac_vendor("00:00:00:dd:ee:ff") is None
+    assert lookup.calls.count("000000") == 1
+    utils._lookup_oui_vendor.cache_clear()